@@ -1,19 +1,53 @@
 import hashlib
 import hmac
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 import jwt
 from ...core.ports.auth_service import AuthService
 from ...core.domain.entities.user import AuthenticatedUser
 
 logger = logging.getLogger(__name__)
 
+JWT_CACHE_MAX_SIZE = 10_000
+JWT_CACHE_TTL_SECONDS = 10.0
+
+
+def _jwt_cache_key(token: str) -> bytes:
+    """Raw truncated SHA-256 of a token; bytes keys hash faster than hex strings"""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
 class SimpleAuthService(AuthService):
-    def __init__(self, api_key: Optional[str], jwt_secret: Optional[str], jwt_algorithm: str = "HS256"):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        jwt_secret: Optional[str],
+        jwt_algorithm: str = "HS256",
+        jwt_cache_ttl: float = JWT_CACHE_TTL_SECONDS,
+        jwt_cache_max_size: int = JWT_CACHE_MAX_SIZE,
+    ):
         self.api_key = api_key
         self.jwt_secret = jwt_secret
         self.jwt_algorithm = jwt_algorithm
+
+        # Decode arguments are fixed per process; build them once instead of per request
+        self._jwt_algorithms = (jwt_algorithm,)
+        self._jwt_decode_options = {"require": ["exp", "sub"], "verify_signature": True}
+
+        # The configured key is fixed per process, so encode and hash it once
+        self._api_key_bytes = api_key.encode() if api_key else None
+        self._api_key_hash = hashlib.sha256(self._api_key_bytes).hexdigest() if api_key else None
+
+        # Verified tokens keyed by truncated sha256 digest -> (user, expires_at).
+        # Only successful verifications are cached; bounded with LRU eviction.
+        self._jwt_cache_ttl = jwt_cache_ttl
+        self._jwt_cache_max_size = jwt_cache_max_size
+        self._jwt_cache: "OrderedDict[bytes, Tuple[AuthenticatedUser, float]]" = OrderedDict()
+        self._jwt_cache_lock = threading.Lock()
     
     async def verify_api_key(self, provided_key: str) -> Optional[AuthenticatedUser]:
         """Verify API key using secure comparison"""
@@ -21,26 +55,39 @@ class SimpleAuthService(AuthService):
             return None
         
         # Use secure comparison to prevent timing attacks
-        if not hmac.compare_digest(self.api_key, provided_key):
+        if not hmac.compare_digest(self._api_key_bytes, provided_key.encode()):
             logger.warning(f"Invalid API key attempt")
             return None
         
-        # Create a hash for user ID (don't log the actual key)
-        key_hash = hashlib.sha256(provided_key.encode()).hexdigest()
-        return AuthenticatedUser.create_api_key_user(key_hash)
+        # Keys matched, so the precomputed hash is the hash of the provided key
+        # (used for the user ID so the actual key is never logged)
+        return AuthenticatedUser.create_api_key_user(self._api_key_hash)
     
     async def verify_jwt_token(self, token: str) -> Optional[AuthenticatedUser]:
         """Verify JWT token"""
         if not self.jwt_secret or not token:
             return None
         
+        cache_key = _jwt_cache_key(token)
+        now = time.time()
+        cached_user = self._get_cached_jwt_user(cache_key, now)
+        if cached_user is not None:
+            return cached_user
+        
         try:
-            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
+            payload = jwt.decode(
+                token,
+                self.jwt_secret,
+                algorithms=self._jwt_algorithms,
+                options=self._jwt_decode_options
+            )
             user_id = payload.get("sub")
             if not user_id:
                 return None
             
-            return AuthenticatedUser.create_jwt_user(user_id, payload)
+            user = AuthenticatedUser.create_jwt_user(user_id, payload)
+            self._cache_jwt_user(cache_key, user, payload.get("exp"), now)
+            return user
         
         except jwt.ExpiredSignatureError:
             logger.warning("JWT token has expired")
@@ -48,3 +95,39 @@ class SimpleAuthService(AuthService):
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid JWT token: {e}")
             return None
+    
+    def _get_cached_jwt_user(self, cache_key: bytes, now: float) -> Optional[AuthenticatedUser]:
+        """Return a previously verified user if its cache entry has not expired"""
+        with self._jwt_cache_lock:
+            entry = self._jwt_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            user, expires_at = entry
+            if expires_at <= now:
+                del self._jwt_cache[cache_key]
+                return None
+
+            self._jwt_cache.move_to_end(cache_key)
+            return user
+
+    def _cache_jwt_user(
+        self,
+        cache_key: bytes,
+        user: AuthenticatedUser,
+        exp: Optional[float],
+        now: float
+    ) -> None:
+        """Cache a verified user until min(exp, now + ttl)"""
+        expires_at = now + self._jwt_cache_ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        if expires_at <= now:
+            return
+
+        with self._jwt_cache_lock:
+            self._jwt_cache[cache_key] = (user, expires_at)
+            self._jwt_cache.move_to_end(cache_key)
+            while len(self._jwt_cache) > self._jwt_cache_max_size:
+                self._jwt_cache.popitem(last=False)
@@ -36,37 +36,44 @@ class DoclingHierarchicalChunking(ChunkingStrategy):
             List[DocumentChunk]: List of created chunks
         """
         try:
-            document_id = metadata.get("document_id", "unknown")
+            # Chunking and per-chunk object construction are both CPU-bound,
+            # so run the whole body off the event loop
+            return await asyncio.to_thread(self._create_chunks_sync, text, metadata)
             
-            # Use Docling's chunker
-            chunks_result = await asyncio.to_thread(
-                self.chunker.chunk,
-                text
+        except Exception as e:
+            raise ChunkingError(f"Docling chunking failed: {str(e)}") from e
+    
+    def _create_chunks_sync(
+        self,
+        text: str,
+        metadata: Dict[str, Any]
+    ) -> List[DocumentChunk]:
+        """Run Docling's chunker and build DocumentChunk entities"""
+        document_id = metadata.get("document_id", "unknown")
+        
+        # Use Docling's chunker
+        chunks_result = self.chunker.chunk(text)
+        
+        document_chunks = []
+        for i, chunk_text in enumerate(chunks_result):
+            # Create chunk metadata
+            chunk_metadata = ChunkMetadata.create_basic(
+                start_char=i * len(chunk_text),  # Simplified - Docling may provide better positions
+                end_char=(i + 1) * len(chunk_text),
+                page_number=None  # Would need to be extracted from Docling structure
             )
             
-            document_chunks = []
-            for i, chunk_text in enumerate(chunks_result):
-                # Create chunk metadata
-                chunk_metadata = ChunkMetadata.create_basic(
-                    start_char=i * len(chunk_text),  # Simplified - Docling may provide better positions
-                    end_char=(i + 1) * len(chunk_text),
-                    page_number=None  # Would need to be extracted from Docling structure
-                )
-                
-                # Create document chunk
-                doc_chunk = DocumentChunk.create(
-                    document_id=document_id,
-                    text=chunk_text,
-                    metadata=chunk_metadata,
-                    sequence_number=i
-                )
-                
-                document_chunks.append(doc_chunk)
-            
-            return document_chunks
+            # Create document chunk
+            doc_chunk = DocumentChunk.create(
+                document_id=document_id,
+                text=chunk_text,
+                metadata=chunk_metadata,
+                sequence_number=i
+            )
             
-        except Exception as e:
-            raise ChunkingError(f"Docling chunking failed: {str(e)}") from e
+            document_chunks.append(doc_chunk)
+        
+        return document_chunks
     
     def get_strategy_name(self) -> str:
         return "docling_hierarchical"
@@ -1,5 +1,6 @@
+import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from ....core.domain.entities.document import Document
 from ....core.domain.entities.document_chunk import DocumentChunk
 from ....core.domain.entities.structured_element import StructuredElement
@@ -12,6 +13,9 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
     Useful for consistent chunk sizes across all documents.
     """
 
+    # Sentence, paragraph, line and clause boundaries, matched in one scan
+    _BOUNDARY_RE = re.compile(r'\. |! |\? |\n\n|\n|; ')
+
     def __init__(
             self,
             chunk_size: int = 512,
@@ -37,29 +41,20 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
         if 'text' in structured_content:
             text = structured_content['text']
         elif 'elements' in structured_content:
-            text = '\n\n'.join(
-                element.get('text', '')
-                for element in structured_content['elements']
-                if element.get('text', '').strip()
-            )
+            fragments = []
+            for element in structured_content['elements']:
+                element_text = element.get('text', '')
+                if element_text.strip():
+                    fragments.append(element_text)
+            text = '\n\n'.join(fragments)
         else:
             text = str(structured_content)
 
         # Split into chunks
         chunks = []
         chunk_index = 0
-        start = 0
-
-        while start < len(text):
-            end = start + self.chunk_size
-
-            # Respect boundaries if requested
-            if self.respect_boundaries and end < len(text):
-                # Look for sentence boundary
-                boundary_pos = self._find_boundary(text, start + self.chunk_size - 100, end)
-                if boundary_pos > start:
-                    end = boundary_pos
 
+        for start, end in self._compute_spans(text):
             chunk_content = text[start:end].strip()
 
             if chunk_content:
@@ -82,19 +77,37 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
                 chunks.append(chunk)
                 chunk_index += 1
 
+        return chunks
+
+    def _compute_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Compute (start, end) offsets of each chunk without slicing the text"""
+        spans = []
+        n = len(text)
+        chunk_size = self.chunk_size
+        step = chunk_size - self.overlap
+        start = 0
+
+        while start < n:
+            end = start + chunk_size
+
+            # Respect boundaries if requested
+            if self.respect_boundaries and end < n:
+                # Look for sentence boundary
+                boundary_pos = self._find_boundary(text, start + chunk_size - 100, end)
+                if boundary_pos > start:
+                    end = boundary_pos
+
+            spans.append((start, end))
+
             # Move to next position with overlap
-            start = max(start + self.chunk_size - self.overlap, end)
+            start = max(start + step, end)
 
-        return chunks
+        return spans
 
     def _find_boundary(self, text: str, search_start: int, search_end: int) -> int:
         """Find the best boundary within the search range"""
-        boundaries = ['. ', '! ', '? ', '\n\n', '\n', '; ']
-
-        best_pos = -1
-        for boundary in boundaries:
-            pos = text.rfind(boundary, search_start, search_end)
-            if pos > best_pos:
-                best_pos = pos + len(boundary)
+        last_match = None
+        for match in self._BOUNDARY_RE.finditer(text, search_start, search_end):
+            last_match = match
 
-        return best_pos if best_pos > search_start else search_end
+        return last_match.end() if last_match else search_end
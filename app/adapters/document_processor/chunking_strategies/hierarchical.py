@@ -1,5 +1,9 @@
+import re
+import asyncio
 import logging
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional, Tuple
 from ....core.domain.entities.document import Document
 from ....core.domain.entities.document_chunk import DocumentChunk
 from ....core.domain.entities.structured_element import StructuredElement
@@ -19,17 +23,25 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
     3. Hierarchical relationships for better understanding
     """
 
+    # Sentence endings and paragraph breaks, matched in one scan
+    _SENTENCE_END_RE = re.compile(r'[.!?]|\n\n')
+    # Paragraph breaks and list-item prefixes for plain-text structure detection
+    _PARAGRAPH_SPLIT_RE = re.compile(r'\n\n+')
+    _LIST_PREFIX_RE = re.compile(r'[•\-*]|\d+\.')
+
     def __init__(
             self,
             small_chunk_size: int = 600,
             large_chunk_size: int = 2000,
             overlap: int = 75,
-            respect_boundaries: bool = True
+            respect_boundaries: bool = True,
+            executor: Optional[Executor] = None  # Defaults to the event loop's executor
     ):
         self.small_chunk_size = small_chunk_size
         self.large_chunk_size = large_chunk_size
         self.overlap = overlap
         self.respect_boundaries = respect_boundaries  # Respect sentence/paragraph boundaries
+        self._executor = executor
 
     def get_strategy_name(self) -> str:
         """Return the name of this chunking strategy"""
@@ -41,19 +53,43 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
             structured_content: Dict[str, Any]
     ) -> List[DocumentChunk]:
         """Create hierarchical chunks from structured content"""
+        # CPU-bound chunking runs off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            self._create_chunks_sync,
+            document,
+            structured_content
+        )
+
+    def _create_chunks_sync(
+            self,
+            document: Document,
+            structured_content: Dict[str, Any]
+    ) -> List[DocumentChunk]:
+        """Synchronous chunking body, run on the executor"""
 
         try:
             # Extract structured elements
             elements = self._extract_structured_elements(structured_content)
 
+            # Document-level metadata is the same for every chunk; build it once
+            base_metadata = {
+                'collection_id': document.collection_id,  # Important for filtering
+                'document_type': str(document.document_type.value),
+                'chunking_strategy': 'hierarchical',
+                **document.metadata
+            }
+
             # Create large chunks first (parent chunks)
-            large_chunks = await self._create_large_chunks(document, elements)
+            large_chunks = self._create_large_chunks(document, elements, base_metadata)
 
             # Create small chunks that reference their parent large chunks
-            small_chunks = await self._create_small_chunks(document, large_chunks)
+            small_chunks = self._create_small_chunks(document, large_chunks)
 
-            # Combine all chunks
-            all_chunks = large_chunks + small_chunks
+            # Combine all chunks in place rather than allocating a new list
+            all_chunks = large_chunks
+            all_chunks.extend(small_chunks)
 
             # Log statistics for monitoring
             stats = self.get_chunk_statistics(all_chunks)
@@ -100,17 +136,17 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
     def _detect_structure_from_text(self, text: str) -> List[StructuredElement]:
         """Basic structure detection from plain text"""
         elements = []
-        paragraphs = text.split('\n\n')
+        list_prefix_match = self._LIST_PREFIX_RE.match
 
-        for i, para in enumerate(paragraphs):
+        for para in self._PARAGRAPH_SPLIT_RE.split(text):
             para = para.strip()
             if not para:
                 continue
 
             # Simple heading detection
-            if len(para) < 100 and (para.isupper() or para.count('\n') == 0):
+            if len(para) < 100 and ('\n' not in para or para.isupper()):
                 element_type = 'heading'
-            elif para.startswith(('•', '-', '*', '1.', '2.', '3.')):
+            elif list_prefix_match(para):
                 element_type = 'list'
             else:
                 element_type = 'paragraph'
@@ -123,16 +159,20 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
 
         return elements
 
-    async def _create_large_chunks(
+    def _create_large_chunks(
             self,
             document: Document,
-            elements: List[StructuredElement]
+            elements: List[StructuredElement],
+            base_metadata: Dict[str, Any]
     ) -> List[DocumentChunk]:
         """Create large chunks (parent chunks) from structured elements"""
         large_chunks = []
+        # Content parts are (content, element_type, page_number) tuples
         current_chunk_content = []
         current_chunk_length = 0
         chunk_index = 0
+        large_cap = self.large_chunk_size
+        overlap = self.overlap
 
         current_context = {
             'headings': [],  # Stack of current headings
@@ -141,37 +181,42 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
         }
 
         for element in elements:
+            content = element.content
+            element_type = element.element_type
+            page_number = element.page_number
+
             # Update context
-            if element.element_type == 'heading':
+            if element_type == 'heading':
                 # Manage heading hierarchy
                 level = element.level or 1
                 current_context['headings'] = current_context['headings'][:level - 1]
-                current_context['headings'].append(element.content)
+                current_context['headings'].append(content)
 
-            if element.page_number:
-                current_context['page_number'] = element.page_number
+            if page_number:
+                current_context['page_number'] = page_number
 
-            element_length = len(element.content)
+            element_length = len(content)
 
             # Check if we need to start a new chunk
-            if (current_chunk_length + element_length > self.large_chunk_size and
+            if (current_chunk_length + element_length > large_cap and
                     current_chunk_content):
 
                 # Create chunk from current content
-                chunk = await self._create_chunk_from_content(
+                chunk = self._create_chunk_from_content(
                     document=document,
                     content_parts=current_chunk_content,
                     chunk_index=chunk_index,
                     chunk_type='large',
-                    context=current_context.copy()
+                    context=current_context.copy(),
+                    base_metadata=base_metadata
                 )
                 large_chunks.append(chunk)
 
                 # Start new chunk with overlap
-                if self.overlap > 0:
-                    overlap_content = self._get_overlap_content(current_chunk_content, self.overlap)
+                if overlap > 0:
+                    overlap_content = self._get_overlap_content(current_chunk_content, overlap)
                     current_chunk_content = overlap_content
-                    current_chunk_length = sum(len(part['content']) for part in overlap_content)
+                    current_chunk_length = sum(len(part[0]) for part in overlap_content)
                 else:
                     current_chunk_content = []
                     current_chunk_length = 0
@@ -179,22 +224,19 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
                 chunk_index += 1
 
             # Add current element to chunk
-            current_chunk_content.append({
-                'content': element.content,
-                'type': element.element_type,
-                'page': element.page_number
-            })
+            current_chunk_content.append((content, element_type, page_number))
             current_chunk_length += element_length
-            current_context['element_types'].append(element.element_type)
+            current_context['element_types'].append(element_type)
 
         # Create final chunk if there's remaining content
         if current_chunk_content:
-            chunk = await self._create_chunk_from_content(
+            chunk = self._create_chunk_from_content(
                 document=document,
                 content_parts=current_chunk_content,
                 chunk_index=chunk_index,
                 chunk_type='large',
-                context=current_context.copy()
+                context=current_context.copy(),
+                base_metadata=base_metadata
             )
             large_chunks.append(chunk)
 
@@ -202,37 +244,33 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
 
     def _get_overlap_content(
             self,
-            content_parts: List[Dict[str, Any]],
+            content_parts: List[Tuple[str, str, Optional[int]]],
             overlap_chars: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tuple[str, str, Optional[int]]]:
         """Get overlap content from the end of current chunk"""
         if not content_parts:
             return []
 
         # Start from the last part and work backwards
-        overlap_parts = []
+        overlap_parts = deque()
         current_length = 0
 
         for part in reversed(content_parts):
-            part_length = len(part['content'])
+            content, part_type, page = part
+            part_length = len(content)
             if current_length + part_length <= overlap_chars:
-                overlap_parts.insert(0, part)
+                overlap_parts.appendleft(part)
                 current_length += part_length
             else:
                 # Take partial content from this part
                 remaining_chars = overlap_chars - current_length
                 if remaining_chars > 50:  # Only if we can get meaningful content
-                    partial_content = part['content'][-remaining_chars:]
-                    overlap_parts.insert(0, {
-                        'content': partial_content,
-                        'type': part['type'],
-                        'page': part.get('page', 1)
-                    })
+                    overlap_parts.appendleft((content[-remaining_chars:], part_type, page))
                 break
 
-        return overlap_parts
+        return list(overlap_parts)
 
-    async def _create_small_chunks(
+    def _create_small_chunks(
             self,
             document: Document,
             large_chunks: List[DocumentChunk]
@@ -249,15 +287,19 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
                 self.overlap
             )
 
+            # Parent metadata is shared read-only; each small chunk only overlays its own keys
+            base_metadata = large_chunk.metadata
+            total_sub_chunks = len(small_chunk_contents)
+
             for i, small_content in enumerate(small_chunk_contents):
                 # Create metadata that references the parent chunk
-                small_chunk_metadata = large_chunk.metadata.copy()
-                small_chunk_metadata.update({
+                small_chunk_metadata = {
+                    **base_metadata,
                     'parent_chunk_id': large_chunk.id,
                     'chunk_size': 'small',
                     'sub_chunk_index': i,
-                    'total_sub_chunks': len(small_chunk_contents)
-                })
+                    'total_sub_chunks': total_sub_chunks
+                }
 
                 small_chunk = DocumentChunk.create(
                     document_id=document.id,
@@ -274,38 +316,44 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
 
         return small_chunks
 
-    async def _create_chunk_from_content(
+    def _create_chunk_from_content(
             self,
             document: Document,
-            content_parts: List[Dict[str, Any]],
+            content_parts: List[Tuple[str, str, Optional[int]]],
             chunk_index: int,
             chunk_type: str,
-            context: Dict[str, Any]
+            context: Dict[str, Any],
+            base_metadata: Dict[str, Any]
     ) -> DocumentChunk:
         """Create a chunk from content parts with rich metadata"""
 
+        # Collect content and structure flags in a single pass over the parts
+        fragments = []
+        element_types = set()
+        page_numbers = set()
+        for part_content, part_type, page in content_parts:
+            fragments.append(part_content)
+            element_types.add(part_type)
+            page_numbers.add(page)
+
         # Combine content
-        content = '\n\n'.join(part['content'] for part in content_parts)
+        content = '\n\n'.join(fragments)
 
         # Create rich metadata that includes collection filtering info
         metadata = {
             'chunk_size': chunk_type,
-            'element_types': list(set(part['type'] for part in content_parts)),
-            'page_numbers': list(set(part.get('page', 1) for part in content_parts)),
+            'element_types': list(element_types),
+            'page_numbers': list(page_numbers),
             'headings_context': context.get('headings', []),
             'word_count': len(content.split()),
             'char_count': len(content),
-            'has_headings': any(part['type'] == 'heading' for part in content_parts),
-            'has_lists': any(part['type'] == 'list' for part in content_parts),
-            'has_tables': any(part['type'] == 'table' for part in content_parts),
-            'collection_id': document.collection_id,  # Important for filtering
-            'document_type': str(document.document_type.value),
-            'chunking_strategy': 'hierarchical'
+            'has_headings': 'heading' in element_types,
+            'has_lists': 'list' in element_types,
+            'has_tables': 'table' in element_types,
+            # Collection filtering info and document metadata
+            **base_metadata
         }
 
-        # Add document metadata
-        metadata.update(document.metadata)
-
         return DocumentChunk.create(
             document_id=document.id,
             collection_id=document.collection_id,
@@ -322,17 +370,19 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
             overlap: int
     ) -> List[str]:
         """Split text into smaller chunks with overlap"""
-        if len(text) <= chunk_size:
+        n = len(text)
+        if n <= chunk_size:
             return [text]
 
         chunks = []
         start = 0
+        step = chunk_size - overlap
 
-        while start < len(text):
+        while start < n:
             end = start + chunk_size
 
             # Try to break at sentence boundary if respecting boundaries
-            if self.respect_boundaries and end < len(text):
+            if self.respect_boundaries and end < n:
                 # Look for sentence endings within the last 100 characters
                 search_start = max(start + chunk_size - 100, start)
                 sentence_end = self._find_sentence_boundary(text, search_start, end)
@@ -344,21 +394,17 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
                 chunks.append(chunk)
 
             # Move start position considering overlap
-            start = max(start + chunk_size - overlap, end)
+            start = max(start + step, end)
 
-            if start >= len(text):
+            if start >= n:
                 break
 
         return chunks
 
     def _find_sentence_boundary(self, text: str, search_start: int, search_end: int) -> int:
         """Find the best sentence boundary within the search range"""
-        sentence_endings = ['.', '!', '?', '\n\n']
-
-        best_pos = -1
-        for ending in sentence_endings:
-            pos = text.rfind(ending, search_start, search_end)
-            if pos > best_pos:
-                best_pos = pos + len(ending)
+        last_match = None
+        for match in self._SENTENCE_END_RE.finditer(text, search_start, search_end):
+            last_match = match
 
-        return best_pos if best_pos > search_start else search_end
+        return last_match.end() if last_match else search_end
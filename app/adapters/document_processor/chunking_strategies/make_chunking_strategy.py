@@ -1,10 +1,31 @@
-from .hierarchical import HierarchicalChunkingStrategy
-from .optimized import OptimizedHierarchicalChunkingStrategy
-from .semantic import SemanticChunkingStrategy
-from .fixed_size import FixedSizeChunkingStrategy
+import functools
+import importlib
+from typing import Any, Tuple
 from ....core.ports.chunking_strategy import ChunkingStrategy
 
 
+# Strategy name -> (module, class); modules are imported only when first requested
+_STRATEGY_REGISTRY = {
+    "hierarchical": (".hierarchical", "HierarchicalChunkingStrategy"),
+    "optimized_hierarchical": (".optimized", "OptimizedHierarchicalChunkingStrategy"),
+    "semantic": (".semantic", "SemanticChunkingStrategy"),
+    "fixed_size": (".fixed_size", "FixedSizeChunkingStrategy")
+}
+
+
+def _load_strategy_class(strategy_name: str) -> type:
+    """Import and return the strategy class registered under strategy_name"""
+    module_name, class_name = _STRATEGY_REGISTRY[strategy_name]
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _create_cached(strategy_name: str, kwargs_items: Tuple[Tuple[str, Any], ...]) -> ChunkingStrategy:
+    """Build a strategy once per (name, config) pair"""
+    return _load_strategy_class(strategy_name)(**dict(kwargs_items))
+
+
 # Factory function for easy strategy creation
 def create_chunking_strategy(
         strategy_name: str = "optimized_hierarchical",
@@ -12,14 +33,15 @@ def create_chunking_strategy(
 ) -> ChunkingStrategy:
     """Factory function to create chunking strategies"""
 
-    strategies = {
-        "hierarchical": HierarchicalChunkingStrategy,
-        "optimized_hierarchical": OptimizedHierarchicalChunkingStrategy,
-        "semantic": SemanticChunkingStrategy,
-        "fixed_size": FixedSizeChunkingStrategy
-    }
+    if strategy_name not in _STRATEGY_REGISTRY:
+        raise ValueError(f"Unknown chunking strategy: {strategy_name}. Available: {list(_STRATEGY_REGISTRY.keys())}")
 
-    if strategy_name not in strategies:
-        raise ValueError(f"Unknown chunking strategy: {strategy_name}. Available: {list(strategies.keys())}")
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        # Unhashable config values can't be memoized; build a fresh instance
+        return _load_strategy_class(strategy_name)(**kwargs)
 
-    return strategies[strategy_name](**kwargs)
+    # Called outside the check so a TypeError from the constructor itself propagates
+    return _create_cached(strategy_name, kwargs_items)
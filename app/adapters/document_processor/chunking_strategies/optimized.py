@@ -1,5 +1,9 @@
+import io
+import re
 import logging
-from typing import List, Dict, Any, Optional
+from collections import deque
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Iterator
 from ....core.domain.entities.document import Document
 from ....core.domain.entities.document_chunk import DocumentChunk
 from ....core.domain.entities.structured_element import StructuredElement
@@ -20,6 +24,12 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
     4. Optimized for mxbai-embed-large (max 512 tokens)
     """
 
+    # Precompiled element classification heuristics
+    _HEADING_LABEL_RE = re.compile(r'title|heading|header')
+    _LIST_LABEL_RE = re.compile(r'list|item|bullet')
+    _HEADING_LEVEL_RE = re.compile(r'h(?:eading)?([1-6])')
+    _LIST_PREFIX_RE = re.compile(r'[•\-*]|[1-3]\.')
+
     def __init__(
             self,
             token_service: TokenService,
@@ -41,6 +51,14 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         # Validate configuration
         self._validate_configuration()
 
+        # A token window holds at most small_chunk_tokens, but boundary-respecting
+        # pieces are only approximately bounded (re-joined sentences and the
+        # character fallback can run over), so the overlap is kept as headroom
+        # before small-chunk validation may be skipped
+        self._small_chunk_validation_needed = (
+            self.small_chunk_tokens + self.overlap_tokens > self.max_embedding_tokens
+        )
+
     def _validate_configuration(self):
         """Validate chunking configuration"""
         if self.small_chunk_tokens >= self.large_chunk_tokens:
@@ -67,20 +85,9 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
     ) -> List[DocumentChunk]:
         """Create optimized hierarchical chunks from structured content"""
         try:
-            # Extract structured elements
-            elements = self._extract_structured_elements(structured_content)
-
-            # Create large chunks first (parent chunks)
-            large_chunks = await self._create_large_chunks(document, elements)
-
-            # Create small chunks that reference their parent large chunks
-            small_chunks = await self._create_small_chunks(document, large_chunks)
-
-            # Validate chunk token counts
-            self._validate_chunk_tokens(large_chunks + small_chunks)
-
-            # Combine all chunks
-            all_chunks = large_chunks + small_chunks
+            # Each large (parent) chunk is followed by its own small chunks, so
+            # in-order consumers such as embedders stay within one context at a time
+            all_chunks = [chunk async for chunk in self.stream_chunks(document, structured_content)]
 
             # Log statistics for monitoring
             stats = self.get_chunk_statistics(all_chunks)
@@ -96,30 +103,50 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         """Extract structured elements from spaCy layout processing results"""
         elements = []
 
+        # Collect candidate (content, source, is_table) triples so they can be
+        # tokenized in a single batch call; text that cannot reach the minimum
+        # never reaches the tokenizer
+        candidates = []
+        min_chunk_tokens = self.min_chunk_tokens
+
         # Handle spaCy layout sections
         if 'sections' in structured_content:
             for section in structured_content['sections']:
                 content = section.get('text', '').strip()
-                if content and self.token_service.count_tokens(content) >= self.min_chunk_tokens:
-                    elements.append(StructuredElement(
-                        content=content,
-                        element_type=self._determine_element_type(section),
-                        level=self._extract_heading_level(section),
-                        page_number=section.get('layout_info', {}).get('page', 1),
-                        bbox=section.get('layout_info', {}).get('bbox')
-                    ))
+                if content and self._max_tokens(content) >= min_chunk_tokens:
+                    candidates.append((content, section, False))
 
         # Handle tables separately
         if 'tables' in structured_content:
             for table in structured_content['tables']:
                 content = table.get('text', '').strip()
-                if content and self.token_service.count_tokens(content) >= self.min_chunk_tokens:
-                    elements.append(StructuredElement(
-                        content=content,
-                        element_type='table',
-                        page_number=table.get('layout_info', {}).get('page', 1),
-                        bbox=table.get('layout_info', {}).get('bbox')
-                    ))
+                if content and self._max_tokens(content) >= min_chunk_tokens:
+                    candidates.append((content, table, True))
+
+        token_counts = self.token_service.count_tokens_batch([c[0] for c in candidates])
+
+        for (content, source, is_table), token_count in zip(candidates, token_counts):
+            if token_count < self.min_chunk_tokens:
+                continue
+
+            layout_info = source.get('layout_info', {})
+            if is_table:
+                elements.append(StructuredElement(
+                    content=content,
+                    element_type='table',
+                    page_number=layout_info.get('page', 1),
+                    bbox=layout_info.get('bbox'),
+                    token_count=token_count
+                ))
+            else:
+                elements.append(StructuredElement(
+                    content=content,
+                    element_type=self._determine_element_type(source),
+                    level=self._extract_heading_level(source),
+                    page_number=layout_info.get('page', 1),
+                    bbox=layout_info.get('bbox'),
+                    token_count=token_count
+                ))
 
         # Fallback to full text if no sections found
         if not elements and 'full_text' in structured_content:
@@ -130,29 +157,40 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         # Filter elements by minimum token count
         filtered_elements = [
             e for e in elements
-            if self.token_service.count_tokens(e.content) >= self.min_chunk_tokens
+            if self._element_tokens(e) >= self.min_chunk_tokens
         ]
 
         logger.info(f"Extracted {len(filtered_elements)} structured elements")
         return filtered_elements
 
+    @staticmethod
+    def _max_tokens(text: str) -> int:
+        """
+        Upper bound on the token count, used to skip tokenizer calls on text too small to keep.
+
+        Every token covers at least one UTF-8 byte, so the byte length never
+        undercounts, whatever the script (a character-based estimate drops
+        CJK text, where one character is often a token of its own).
+        """
+        return len(text) if text.isascii() else len(text.encode('utf-8'))
+
     def _determine_element_type(self, section: Dict[str, Any]) -> str:
         """Determine element type from section information"""
         label = section.get('label', '').lower()
         text = section.get('text', '')
 
         # Check for heading patterns
-        if any(heading_word in label for heading_word in ['title', 'heading', 'header']):
+        if self._HEADING_LABEL_RE.search(label):
             return 'heading'
 
         # Check for list patterns
-        if any(list_word in label for list_word in ['list', 'item', 'bullet']):
+        if self._LIST_LABEL_RE.search(label):
             return 'list'
 
         # Simple heuristics based on text
-        if len(text) < 100 and (text.isupper() or text.count('\n') == 0):
+        if len(text) < 100 and (text.isupper() or '\n' not in text):
             return 'heading'
-        elif text.strip().startswith(('•', '-', '*', '1.', '2.', '3.')):
+        elif self._LIST_PREFIX_RE.match(text.strip()):
             return 'list'
 
         return 'paragraph'
@@ -162,10 +200,10 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         label = section.get('label', '').lower()
         heading = section.get('heading', '')
 
-        # Try to extract level from label
-        for i in range(1, 7):
-            if f'h{i}' in label or f'heading{i}' in label:
-                return i
+        # Try to extract level from label (h1-h6 / heading1-heading6)
+        level_match = self._HEADING_LEVEL_RE.search(label)
+        if level_match:
+            return int(level_match.group(1))
 
         # Try to infer from heading text patterns
         if heading and isinstance(heading, str):
@@ -175,47 +213,120 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
 
         return None
 
+    @staticmethod
+    def _iter_paragraphs(text: str) -> Iterator[str]:
+        """Yield the pieces of text.split('\\n\\n') lazily, without building the full list"""
+        start = 0
+        while (end := text.find('\n\n', start)) != -1:
+            yield text[start:end]
+            start = end + 2
+        yield text[start:]
+
     def _split_text_into_elements(self, text: str) -> List[StructuredElement]:
         """Split plain text into structured elements"""
         elements = []
-        paragraphs = text.split('\n\n')
+        min_chunk_tokens = self.min_chunk_tokens
 
-        for para in paragraphs:
+        # Stream paragraphs and keep only those that might be large enough;
+        # ones too short to reach the minimum are skipped without invoking the tokenizer
+        candidates = []
+        for para in self._iter_paragraphs(text):
             para = para.strip()
-            if not para or self.token_service.count_tokens(para) < self.min_chunk_tokens:
+            if para and self._max_tokens(para) >= min_chunk_tokens:
+                candidates.append(para)
+
+        token_counts = self.token_service.count_tokens_batch(candidates)
+
+        for para, token_count in zip(candidates, token_counts):
+            if token_count < self.min_chunk_tokens:
                 continue
 
             # Simple structure detection
             element_type = 'paragraph'
             if len(para) < 200 and (para.isupper() or '\n' not in para):
                 element_type = 'heading'
-            elif para.startswith(('•', '-', '*', '1.', '2.', '3.')):
+            elif self._LIST_PREFIX_RE.match(para):
                 element_type = 'list'
 
             elements.append(StructuredElement(
                 content=para,
                 element_type=element_type,
-                page_number=1
+                page_number=1,
+                token_count=token_count
             ))
 
         return elements
 
-    async def _create_large_chunks(
+    async def stream_chunks(
             self,
             document: Document,
+            structured_content: Dict[str, Any]
+    ) -> AsyncIterator[DocumentChunk]:
+        """
+        Yield validated chunks as they are produced.
+
+        Each large (parent) chunk is yielded as soon as it is built, followed
+        by the small chunks cut from it, so consumers can start embedding
+        before the whole document has been chunked.
+        """
+        # Extract structured elements
+        elements = self._extract_structured_elements(structured_content)
+
+        # Document-level metadata is identical for every chunk, so build it once;
+        # document metadata goes last so it keeps overriding the strategy keys
+        base_metadata = {
+            'collection_id': document.collection_id,
+            'document_type': str(document.document_type.value),
+            'chunking_strategy': 'optimized_hierarchical',
+            'overlap_tokens': self.overlap_tokens,
+            'structure_preserved': True,
+            **(document.metadata or {})
+        }
+
+        small_chunk_index = 0
+
+        # Chunk building is pure CPU work, so it is called directly rather than
+        # through per-chunk coroutines; only the yields suspend the generator
+        for chunk_elements, chunk_index, snapshot in self._iter_large_chunk_specs(elements):
+            large_chunk, token_ids = self._build_chunk_from_elements(
+                document=document,
+                elements=chunk_elements,
+                chunk_index=chunk_index,
+                chunk_type='large',
+                context=snapshot,
+                base_metadata=base_metadata
+            )
+            self._validate_chunk_tokens([large_chunk])
+            yield large_chunk
+
+            # Small chunks that reference this large chunk
+            small_chunks = self._create_small_chunks(
+                document, large_chunk, token_ids, small_chunk_index
+            )
+            small_chunk_index += len(small_chunks)
+            if self._small_chunk_validation_needed or logger.isEnabledFor(logging.DEBUG):
+                self._validate_chunk_tokens(small_chunks)
+            for small_chunk in small_chunks:
+                yield small_chunk
+
+    def _iter_large_chunk_specs(
+            self,
             elements: List[StructuredElement]
-    ) -> List[DocumentChunk]:
-        """Create large chunks (parent chunks) from structured elements"""
-        large_chunks = []
-        current_chunk_elements = []
+    ) -> Iterator[Tuple[List[StructuredElement], int, Dict[str, Any]]]:
+        """Pack elements into large chunks, yielding (elements, chunk_index, context snapshot)"""
+        # (element, token_count) pairs of the chunk being filled; the running
+        # total is kept in step so overlap never needs recounting
+        current_chunk_elements = deque()
         current_token_count = 0
         chunk_index = 0
+        large_chunk_tokens = self.large_chunk_tokens
+        overlap_tokens = self.overlap_tokens
 
         # Track document context
         context = {
             'headings': [],  # Hierarchical heading stack
             'page_number': 1,
-            'element_types': [],
+            'element_types': [],  # Types seen in the current chunk; reset on flush
             'tables_count': 0,
             'lists_count': 0
         }
@@ -224,50 +335,67 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
             # Update context
             self._update_context(context, element)
 
-            element_tokens = self.token_service.count_tokens(element.content)
+            element_tokens = self._element_tokens(element)
 
             # Check if adding this element would exceed token limit
-            if (current_token_count + element_tokens > self.large_chunk_tokens
-                    and current_chunk_elements):
-                # Create chunk from current elements
-                chunk = await self._create_chunk_from_elements(
-                    document=document,
-                    elements=current_chunk_elements,
-                    chunk_index=chunk_index,
-                    chunk_type='large',
-                    context=context.copy()
+            if self._should_flush(
+                    current_token_count, element_tokens, large_chunk_tokens,
+                    bool(current_chunk_elements)):
+                # Emit chunk from current elements
+                yield (
+                    [elem for elem, _ in current_chunk_elements], chunk_index,
+                    self._snapshot_context(context)
                 )
-                large_chunks.append(chunk)
+                context['element_types'] = [element.element_type]
 
-                # Start new chunk with overlap
-                overlap_elements = self._get_overlap_elements(
-                    current_chunk_elements,
-                    self.overlap_tokens
-                )
-
-                current_chunk_elements = overlap_elements
-                current_token_count = sum(
-                    self.token_service.count_tokens(elem.content)
-                    for elem in overlap_elements
+                # Start new chunk with the trailing elements that fit in the overlap budget
+                current_chunk_elements, current_token_count = self._advance_overlap(
+                    current_chunk_elements, overlap_tokens
                 )
                 chunk_index += 1
 
             # Add current element
-            current_chunk_elements.append(element)
+            current_chunk_elements.append((element, element_tokens))
             current_token_count += element_tokens
 
-        # Create final chunk
+        # Emit final chunk
         if current_chunk_elements:
-            chunk = await self._create_chunk_from_elements(
-                document=document,
-                elements=current_chunk_elements,
-                chunk_index=chunk_index,
-                chunk_type='large',
-                context=context.copy()
+            yield (
+                [elem for elem, _ in current_chunk_elements], chunk_index,
+                self._snapshot_context(context)
             )
-            large_chunks.append(chunk)
 
-        return large_chunks
+    @staticmethod
+    def _should_flush(current_tokens: int, element_tokens: int, limit: int, has_elements: bool) -> bool:
+        """Whether the current chunk must be closed before adding an element"""
+        return has_elements and current_tokens + element_tokens > limit
+
+    @staticmethod
+    def _advance_overlap(
+            chunk_elements: "deque[Tuple[StructuredElement, int]]",
+            overlap_tokens: int
+    ) -> Tuple["deque[Tuple[StructuredElement, int]]", int]:
+        """
+        Pop the trailing (element, tokens) pairs that fit in the overlap budget.
+
+        Returns the overlap as a new deque to seed the next chunk, together
+        with its token total. Consumes chunk_elements.
+        """
+        overlap_elements = deque()
+        overlap_total = 0
+        while chunk_elements and overlap_total + chunk_elements[-1][1] <= overlap_tokens:
+            item = chunk_elements.pop()
+            overlap_elements.appendleft(item)
+            overlap_total += item[1]
+        return overlap_elements, overlap_total
+
+    @staticmethod
+    def _snapshot_context(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy only the context persisted into chunk metadata, not the running counters"""
+        return {
+            'headings': context['headings'][-3:],
+            'page_number': context['page_number']
+        }
 
     def _update_context(self, context: Dict[str, Any], element: StructuredElement):
         """Update document context with current element"""
@@ -287,72 +415,67 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         elif element.element_type == 'list':
             context['lists_count'] += 1
 
-    def _get_overlap_elements(
-            self,
-            elements: List[StructuredElement],
-            max_overlap_tokens: int
-    ) -> List[StructuredElement]:
-        """Get elements from the end for overlap"""
-        if not elements or max_overlap_tokens <= 0:
-            return []
-
-        overlap_elements = []
-        current_tokens = 0
-
-        # Start from the end and work backwards
-        for element in reversed(elements):
-            element_tokens = self.token_service.count_tokens(element.content)
-            if current_tokens + element_tokens <= max_overlap_tokens:
-                overlap_elements.insert(0, element)
-                current_tokens += element_tokens
-            else:
-                break
-
-        return overlap_elements
-
-    async def _create_chunk_from_elements(
+    def _build_chunk_from_elements(
             self,
             document: Document,
             elements: List[StructuredElement],
             chunk_index: int,
             chunk_type: str,
-            context: Dict[str, Any]
-    ) -> DocumentChunk:
-        """Create a chunk from structured elements with rich metadata"""
-        # Combine element content intelligently
-        content_parts = []
-        for element in elements:
-            if element.element_type == 'heading':
-                content_parts.append(f"\n## {element.content}\n")
-            elif element.element_type == 'table':
-                content_parts.append(f"\n[TABLE]\n{element.content}\n")
+            context: Dict[str, Any],
+            base_metadata: Dict[str, Any]
+    ) -> Tuple[DocumentChunk, List[int]]:
+        """Build a single chunk and its metadata from structured elements"""
+        # Combine element content intelligently, collecting metadata in the same pass.
+        # Pieces are written straight into one buffer instead of formatting a
+        # string per element and joining them afterwards.
+        buffer = io.StringIO()
+        write = buffer.write
+        element_types = set()
+        page_numbers = set()
+        has_headings = has_lists = has_tables = False
+        for position, element in enumerate(elements):
+            element_type = element.element_type
+            element_types.add(element_type)
+            if element.page_number:
+                page_numbers.add(element.page_number)
+
+            if position:
+                write("\n")
+            if element_type == 'heading':
+                has_headings = True
+                write("\n## ")
+                write(element.content)
+                write("\n")
+            elif element_type == 'table':
+                has_tables = True
+                write("\n[TABLE]\n")
+                write(element.content)
+                write("\n")
             else:
-                content_parts.append(element.content)
+                if element_type == 'list':
+                    has_lists = True
+                write(element.content)
+
+        content = buffer.getvalue().strip()
 
-        content = "\n".join(content_parts).strip()
+        # Encode once; the token IDs are reused to cut small chunks without re-tokenizing
+        token_ids = self.token_service.encode_text(content)
 
         # Create comprehensive metadata
         metadata = {
             'chunk_size': chunk_type,
-            'token_count': self.token_service.count_tokens(content),
-            'element_types': list(set(e.element_type for e in elements)),
-            'page_numbers': list(set(e.page_number for e in elements if e.page_number)),
+            'token_count': len(token_ids),
+            'element_types': list(element_types),
+            'page_numbers': list(page_numbers),
             'headings_context': context.get('headings', [])[-3:],  # Last 3 headings
-            'has_headings': any(e.element_type == 'heading' for e in elements),
-            'has_lists': any(e.element_type == 'list' for e in elements),
-            'has_tables': any(e.element_type == 'table' for e in elements),
+            'has_headings': has_headings,
+            'has_lists': has_lists,
+            'has_tables': has_tables,
             'element_count': len(elements),
-            'collection_id': document.collection_id,
-            'document_type': str(document.document_type.value),
-            'chunking_strategy': 'optimized_hierarchical',
-            'overlap_tokens': self.overlap_tokens,
-            'structure_preserved': True
+            **base_metadata
         }
 
-        # Add document metadata
-        metadata.update(document.metadata or {})
-
-        return DocumentChunk.create(
+        chunk = DocumentChunk.create(
             document_id=document.id,
             collection_id=document.collection_id,
             content=content,
@@ -360,59 +483,128 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
             chunk_type=chunk_type,
             metadata=metadata
         )
+        return chunk, token_ids
 
-    async def _create_small_chunks(
+    def _create_small_chunks(
             self,
             document: Document,
-            large_chunks: List[DocumentChunk]
+            large_chunk: DocumentChunk,
+            token_ids: List[int],
+            start_index: int
     ) -> List[DocumentChunk]:
-        """Create small chunks from large chunks using token-aware splitting"""
-        small_chunks = []
-        small_chunk_index = 0
-
-        for large_chunk in large_chunks:
-            # Split large chunk content into smaller token-based pieces
+        """
+        Create small chunks from a large chunk.
+
+        With respect_boundaries the content is split on sentence and word
+        boundaries; otherwise windows are sliced straight out of the large
+        chunk's token IDs without re-tokenizing.
+        """
+        n = len(token_ids)
+        if n <= self.small_chunk_tokens:
+            windows = [(large_chunk.content, n)]
+        elif self.respect_boundaries:
             small_contents = self.token_service.split_text_by_tokens(
                 text=large_chunk.content,
                 max_tokens=self.small_chunk_tokens,
                 overlap_tokens=self.overlap_tokens
             )
+            windows = list(zip(small_contents, self.token_service.count_tokens_batch(small_contents)))
+        else:
+            windows = self._token_windows(token_ids)
 
-            for i, small_content in enumerate(small_contents):
-                # Ensure minimum token count
-                if self.token_service.count_tokens(small_content) < self.min_chunk_tokens:
-                    continue
-
-                # Create metadata referencing parent chunk
-                small_metadata = large_chunk.metadata.copy()
-                small_metadata.update({
-                    'parent_chunk_id': large_chunk.id,
-                    'chunk_size': 'small',
-                    'sub_chunk_index': i,
-                    'total_sub_chunks': len(small_contents),
-                    'token_count': self.token_service.count_tokens(small_content),
-                    'derived_from_large': True
-                })
-
-                small_chunk = DocumentChunk.create(
-                    document_id=document.id,
-                    collection_id=document.collection_id,
-                    content=small_content,
-                    chunk_index=small_chunk_index,
-                    chunk_type='small',
-                    parent_chunk_id=large_chunk.id,
-                    metadata=small_metadata
-                )
+        small_chunks = []
+        small_chunk_index = start_index
+
+        # Parent metadata is shared read-only; each small chunk only overlays its own keys
+        base_metadata = large_chunk.metadata
+        total_sub_chunks = len(windows)
+
+        for i, (small_content, small_token_count) in enumerate(windows):
+            # Ensure minimum token count
+            if small_token_count < self.min_chunk_tokens:
+                continue
 
-                small_chunks.append(small_chunk)
-                small_chunk_index += 1
+            # Create metadata referencing parent chunk
+            small_metadata = {
+                **base_metadata,
+                'parent_chunk_id': large_chunk.id,
+                'chunk_size': 'small',
+                'sub_chunk_index': i,
+                'total_sub_chunks': total_sub_chunks,
+                'token_count': small_token_count,
+                'validated_token_count': small_token_count,
+                'derived_from_large': True
+            }
+
+            small_chunks.append(DocumentChunk.create(
+                document_id=document.id,
+                collection_id=document.collection_id,
+                content=small_content,
+                chunk_index=small_chunk_index,
+                chunk_type='small',
+                parent_chunk_id=large_chunk.id,
+                metadata=small_metadata
+            ))
+            small_chunk_index += 1
 
         return small_chunks
 
+    def _token_windows(self, token_ids: List[int]) -> List[Tuple[str, int]]:
+        """
+        Slice overlapping token windows into (text, token_count) pairs.
+
+        A window edge can fall inside a multi-byte character, which decodes to
+        U+FFFD; such edges are pulled inwards a token at a time (a character
+        spans at most four tokens, so at most three per edge), and the overlap
+        between windows keeps the character whole in the neighbouring window.
+        """
+        window = self.small_chunk_tokens
+        step = self.small_chunk_tokens - self.overlap_tokens
+        n = len(token_ids)
+
+        windows = []
+        for start in range(0, n, step):
+            end = min(start + window, n)
+            window_start, window_end = start, end
+            text = self.token_service.decode_tokens(token_ids[window_start:window_end])
+            for _ in range(6):
+                if text.startswith("\ufffd") and window_start > 0:
+                    window_start += 1
+                elif text.endswith("\ufffd") and window_end < n:
+                    window_end -= 1
+                else:
+                    break
+                text = self.token_service.decode_tokens(token_ids[window_start:window_end])
+            windows.append((text, window_end - window_start))
+            if end == n:
+                break
+
+        return windows
+
+    def _element_tokens(self, element: StructuredElement) -> int:
+        """Token count of an element, computed once and cached on the element"""
+        if element.token_count is None:
+            element.token_count = self.token_service.count_tokens(element.content)
+        return element.token_count
+
+    def _chunks_tokens(self, chunks: List[DocumentChunk]) -> List[int]:
+        """Token counts for chunks, reusing counts recorded at creation time; missing ones are batched"""
+        token_counts = [
+            chunk.metadata.get('token_count') if chunk.metadata else None
+            for chunk in chunks
+        ]
+        missing = [i for i, count in enumerate(token_counts) if count is None]
+        if missing:
+            batch_counts = self.token_service.count_tokens_batch(
+                [chunks[i].content for i in missing]
+            )
+            for i, count in zip(missing, batch_counts):
+                token_counts[i] = count
+        return token_counts
+
     def _validate_chunk_tokens(self, chunks: List[DocumentChunk]):
         """Validate that chunks don't exceed token limits"""
-        for chunk in chunks:
-            token_count = self.token_service.count_tokens(chunk.content)
+        for chunk, token_count in zip(chunks, self._chunks_tokens(chunks)):
 
             if token_count > self.max_embedding_tokens:
                 logger.warning(
@@ -420,8 +612,10 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
                     f"exceeding max embedding tokens ({self.max_embedding_tokens})"
                 )
 
-            # Update metadata with actual token count
+            # Update metadata with actual token count; counts that had to be computed
+            # here are stored as token_count too so statistics never recount them
             if chunk.metadata:
+                chunk.metadata.setdefault('token_count', token_count)
                 chunk.metadata['validated_token_count'] = token_count
 
     def get_chunk_statistics(self, chunks: List[DocumentChunk]) -> Dict[str, Any]:
@@ -429,54 +623,55 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
         if not chunks:
             return {}
 
-        # Separate small and large chunks
-        small_chunks = [c for c in chunks if c.chunk_type == 'small']
-        large_chunks = [c for c in chunks if c.chunk_type == 'large']
-
-        # Calculate token statistics
-        all_tokens = [self.token_service.count_tokens(c.content) for c in chunks]
-        small_tokens = [self.token_service.count_tokens(c.content) for c in small_chunks]
-        large_tokens = [self.token_service.count_tokens(c.content) for c in large_chunks]
+        # Token counts as one array with boolean masks per chunk type
+        all_tokens = np.fromiter(self._chunks_tokens(chunks), dtype=np.int64, count=len(chunks))
+        chunk_types = [c.chunk_type for c in chunks]
+        small_mask = np.fromiter((t == 'small' for t in chunk_types), dtype=bool, count=len(chunks))
+        large_mask = np.fromiter((t == 'large' for t in chunk_types), dtype=bool, count=len(chunks))
+        small_tokens = all_tokens[small_mask]
+        large_tokens = all_tokens[large_mask]
+        small_count = int(small_tokens.size)
+        large_count = int(large_tokens.size)
 
         stats = {
             "total_chunks": len(chunks),
-            "small_chunks": len(small_chunks),
-            "large_chunks": len(large_chunks),
+            "small_chunks": small_count,
+            "large_chunks": large_count,
             "strategy": self.get_strategy_name(),
 
             # Token statistics
-            "avg_tokens": sum(all_tokens) / len(all_tokens) if all_tokens else 0,
-            "min_tokens": min(all_tokens) if all_tokens else 0,
-            "max_tokens": max(all_tokens) if all_tokens else 0,
-            "total_tokens": sum(all_tokens),
+            "avg_tokens": float(all_tokens.mean()),
+            "min_tokens": int(all_tokens.min()),
+            "max_tokens": int(all_tokens.max()),
+            "total_tokens": int(all_tokens.sum()),
 
             # Small chunk statistics
-            "small_avg_tokens": sum(small_tokens) / len(small_tokens) if small_tokens else 0,
-            "small_min_tokens": min(small_tokens) if small_tokens else 0,
-            "small_max_tokens": max(small_tokens) if small_tokens else 0,
+            "small_avg_tokens": float(small_tokens.mean()) if small_count else 0,
+            "small_min_tokens": int(small_tokens.min()) if small_count else 0,
+            "small_max_tokens": int(small_tokens.max()) if small_count else 0,
 
             # Large chunk statistics
-            "large_avg_tokens": sum(large_tokens) / len(large_tokens) if large_tokens else 0,
-            "large_min_tokens": min(large_tokens) if large_tokens else 0,
-            "large_max_tokens": max(large_tokens) if large_tokens else 0,
+            "large_avg_tokens": float(large_tokens.mean()) if large_count else 0,
+            "large_min_tokens": int(large_tokens.min()) if large_count else 0,
+            "large_max_tokens": int(large_tokens.max()) if large_count else 0,
 
             # Content analysis
-            "chunk_types": list(set(c.chunk_type for c in chunks)),
+            "chunk_types": list(set(chunk_types)),
             "element_types": list(set(
                 elem_type for c in chunks
                 for elem_type in c.metadata.get('element_types', [])
             )),
-            "has_hierarchical_structure": len(large_chunks) > 0 and len(small_chunks) > 0,
+            "has_hierarchical_structure": large_count > 0 and small_count > 0,
             "avg_elements_per_chunk": sum(
                 c.metadata.get('element_count', 1) for c in chunks
             ) / len(chunks) if chunks else 0,
 
             # Validation flags
-            "chunks_exceeding_embedding_limit": sum(
-                1 for tokens in all_tokens if tokens > self.max_embedding_tokens
+            "chunks_exceeding_embedding_limit": int(
+                np.count_nonzero(all_tokens > self.max_embedding_tokens)
             ),
-            "chunks_below_minimum": sum(
-                1 for tokens in all_tokens if tokens < self.min_chunk_tokens
+            "chunks_below_minimum": int(
+                np.count_nonzero(all_tokens < self.min_chunk_tokens)
             )
         }
 
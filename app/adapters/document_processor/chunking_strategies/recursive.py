@@ -1,3 +1,4 @@
+import functools
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from typing import List, Dict, Any
@@ -6,6 +7,17 @@ from ....core.domain.entities.document_chunk import DocumentChunk
 from ....core.ports.chunking_strategy import ChunkingStrategy
 
 
+@functools.lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Build a splitter once per (chunk_size, chunk_overlap); split_text keeps no state"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        is_separator_regex=False,
+    )
+
+
 class RecursiveChunkingStrategy(ChunkingStrategy):
     """
     It tries to split on them in order until the chunks are small enough.
@@ -35,28 +47,19 @@ class RecursiveChunkingStrategy(ChunkingStrategy):
     ) -> List[DocumentChunk]:
         """Create chunks"""
 
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.target_chunk_size,
-            chunk_overlap=50,
-            length_function=len,
-            is_separator_regex=False,
-        )
-        docs = text_splitter.create_documents([complete_text])
-
-        chunks = []
-
-        for doc in docs:
-            chunk = self._create_chunk_from_content(doc, doc.id, doc)
-            chunks.append(chunk)
-
-        return chunks
+        text_splitter = _get_splitter(self.target_chunk_size, 50)
+        # split_text returns plain strings; create_documents would wrap each one in a
+        # LangChain Document only for it to be unwrapped again
+        texts = text_splitter.split_text(complete_text)
 
-    def _create_chunk_from_content(self, document: Document, chunk_index: int, lang_doc) -> DocumentChunk:
-        return DocumentChunk.create(
+        return [
+            DocumentChunk.create(
                 document_id=document.id,
                 collection_id=document.collection_id,
-                content=lang_doc.page_content,
-                chunk_index=chunk_index,
+                content=text,
+                chunk_index=i,
                 chunk_type="recursive",
-                metadata=lang_doc.metadata,
+                metadata={},
             )
+            for i, text in enumerate(texts)
+        ]
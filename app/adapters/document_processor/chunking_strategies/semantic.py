@@ -23,6 +23,12 @@ class SemanticChunkingStrategy(ChunkingStrategy):
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
 
+        # Delegate strategy is stateless per document, so build it once and reuse it
+        self._hierarchical_strategy = HierarchicalChunkingStrategy(
+            small_chunk_size=target_chunk_size,
+            large_chunk_size=max_chunk_size
+        )
+
     def get_strategy_name(self) -> str:
         """Return the name of this chunking strategy"""
         return "semantic"
@@ -36,9 +42,4 @@ class SemanticChunkingStrategy(ChunkingStrategy):
 
         # For now, fall back to a simpler structure-aware approach
         # In a full implementation, you'd use embeddings to compute similarity
-        hierarchical_strategy = HierarchicalChunkingStrategy(
-            small_chunk_size=self.target_chunk_size,
-            large_chunk_size=self.max_chunk_size
-        )
-
-        return await hierarchical_strategy.create_chunks(document, structured_content)
+        return await self._hierarchical_strategy.create_chunks(document, structured_content)
@@ -1,16 +1,98 @@
-import spacy
+import os
+import sys
+import hashlib
+import functools
+import asyncio
+import pypdfium2
 from spacy_layout import spaCyLayout
-from docling.document_converter import DocumentConverter
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.datamodel.pipeline_options import PdfPipelineOptions, AcceleratorOptions, AcceleratorDevice
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling_core.types.doc import DoclingDocument, TableItem, TextItem
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 from ...core.ports.document_processor import DocumentProcessor
 from ...core.domain.entities.document import Document
 from ...core.domain.entities.document_chunk import DocumentChunk
 from ...core.domain.exceptions import DocumentProcessingError, InvalidDocumentTypeError
 from ...core.ports.token_service import TokenService
+from .simple_spacy_layout import SimpleSpacyLayoutProcessor, load_spacy_model, worker_mp_context
+from .token_splitting import TokenTextSplitter
+
+# Upper bound on page extraction worker processes
+MAX_PAGE_WORKERS = 4
+
+@functools.lru_cache(maxsize=4)
+def _load_pdf_converter(pipeline_options_json: str) -> DocumentConverter:
+    """
+    Build a docling converter once per process and pipeline configuration.
+
+    Keyed by the serialized options since PdfPipelineOptions isn't hashable.
+    pypdfium skips docling-parse's structural analysis, which is faster and
+    lighter on text-heavy PDFs. The PDF pipeline and its models are loaded
+    here rather than on the first convert, so processors built at startup
+    take the model load off the first document's latency.
+    """
+    pipeline_options = PdfPipelineOptions.model_validate_json(pipeline_options_json)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend
+            )
+        }
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
+
+def _iter_document_paragraphs(document: DoclingDocument) -> Iterator[str]:
+    """
+    Yield the non-empty text of each body item in reading order.
+    
+    Reads item text straight from docling's document model instead of running
+    export_to_text's serializer, which builds its own intermediate copies.
+    """
+    for item, _level in document.iterate_items():
+        if isinstance(item, TextItem):
+            text = item.text
+        elif isinstance(item, TableItem):
+            text = item.export_to_markdown(doc=document)
+        else:
+            continue
+        
+        text = text.strip()
+        if text:
+            yield text
+
+
+def _document_text(document: DoclingDocument) -> str:
+    """Join a docling document's paragraphs into one string, built in a single pass"""
+    return "\n\n".join(_iter_document_paragraphs(document))
+
+
+def _extract_page_range(
+        file_path: str,
+        start_page: int,
+        end_page: int,
+        pipeline_options: PdfPipelineOptions
+) -> str:
+    """
+    Extract text from an inclusive, 1-based page range inside a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor; the converter is
+    cached per worker so it is only constructed once per configuration.
+    """
+    converter = _load_pdf_converter(pipeline_options.model_dump_json())
+    conversion_result = converter.convert(file_path, page_range=(start_page, end_page))
+    if not conversion_result.document:
+        return ""
+    return _document_text(conversion_result.document)
+
 
 class OptimizedSpacyLayoutProcessor(DocumentProcessor):
     """Optimized spaCy Layout processor with faster PDF processing"""
@@ -28,7 +110,24 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
             images_scale: float = 1.0,
             generate_page_images: bool = False,
             generate_table_images: bool = False,
-            generate_picture_images: bool = False
+            generate_picture_images: bool = False,
+            # Device for docling's layout/table models: "auto" picks CUDA/MPS when present
+            accelerator_device: str = "auto",
+            # Fall back to spaCy's sentencizer for paragraphs the regex cannot split
+            use_spacy_sentences: bool = False,
+            # Paragraphs per nlp.pipe batch when use_spacy_sentences is set
+            sentence_batch_size: int = 64,
+            # Spread large nlp.pipe batches over worker processes
+            # (off by default on Windows, where process start-up is too costly)
+            parallel_sentencize: bool = sys.platform != "win32",
+            # Pool for blocking extraction and chunking; defaults to the event loop's executor
+            executor: Optional[Executor] = None,
+            # PDFs with at least this many pages are split into page ranges
+            # and extracted in parallel worker processes
+            parallel_page_threshold: int = 32,
+            max_page_workers: Optional[int] = None,
+            # Directory for extracted text keyed by file content; None disables caching
+            cache_dir: Optional[str] = None
     ):
         self.logger = logging.getLogger(__name__)
         self.token_service = token_service
@@ -36,15 +135,30 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
         self.fast_pdf_mode = fast_pdf_mode
+        self.use_spacy_sentences = use_spacy_sentences
+        self.sentence_batch_size = sentence_batch_size
+        self.parallel_sentencize = parallel_sentencize
+        self._executor = executor
+        self.parallel_page_threshold = parallel_page_threshold
+        # Every page worker loads its own copy of docling's layout models, so the pool is capped
+        self.max_page_workers = min(max_page_workers or os.cpu_count() or 1, MAX_PAGE_WORKERS)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
         
-        try:
-            # Load spaCy model
-            self.nlp = spacy.load(spacy_model)
-            self.logger.info(f"Loaded spaCy model: {spacy_model}")
-        except OSError:
-            # Fallback to blank model if specific model not available
-            self.nlp = spacy.blank("en")
-            self.logger.warning(f"Could not load {spacy_model}, using blank English model")
+        # Load spaCy model (shared with every spaCy-based processor; falls back to a blank model)
+        self.nlp = load_spacy_model(spacy_model, SimpleSpacyLayoutProcessor.DEFAULT_LOCAL_MODEL_PATH)
+        
+        self._splitter = TokenTextSplitter(
+            token_service,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            min_chunk_size=min_chunk_size,
+            use_spacy_sentences=use_spacy_sentences,
+            spacy_lang=self.nlp.lang,
+            sentence_batch_size=sentence_batch_size,
+            parallel_sentencize=parallel_sentencize
+        )
         
         # Always initialize spaCy Layout as fallback
         self.layout = spaCyLayout(self.nlp)
@@ -64,15 +178,17 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
                     table_structure_options={
                         "do_cell_matching": False,  # Disable cell matching for speed
                         "do_table_structure": False  # Disable table structure detection
-                    }
+                    },
+                    # Run models on the GPU when one is available, otherwise on the CPU cores,
+                    # divided between page workers so parallel ranges don't oversubscribe them
+                    accelerator_options=AcceleratorOptions(
+                        num_threads=max(1, (os.cpu_count() or 1) // self.max_page_workers),
+                        device=AcceleratorDevice(accelerator_device)
+                    )
                 )
                 
-                # Create optimized document converter
-                self.document_converter = DocumentConverter(
-                    format_options={
-                        InputFormat.PDF: self.pdf_pipeline_options
-                    }
-                )
+                # Create optimized document converter (shared across processor instances)
+                self.document_converter = _load_pdf_converter(self.pdf_pipeline_options.model_dump_json())
                 
                 # Use direct docling converter instead of spacy-layout for PDFs
                 self.use_direct_docling = True
@@ -83,6 +199,20 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
                 self.use_direct_docling = False
         else:
             self.use_direct_docling = False
+        
+        # Extracted text depends on the converter configuration, so it is part of the cache key
+        extraction_config = (
+            self.pdf_pipeline_options.model_dump_json() if self.use_direct_docling else "spacy-layout"
+        )
+        self._extraction_config_digest = hashlib.sha256(extraction_config.encode()).hexdigest()[:16]
+        
+        # Worker processes are only started on first submit, i.e. for the first large PDF, and
+        # start fresh rather than forking this multi-threaded process
+        self._page_pool = (
+            ProcessPoolExecutor(max_workers=self.max_page_workers, mp_context=worker_mp_context())
+            if self.use_direct_docling and self.max_page_workers > 1
+            else None
+        )
             
         self.supported_types = ["pdf", "docx", "doc"]
 
@@ -94,15 +224,36 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
                     f"Document type {document.document_type.value} not supported"
                 )
             
-            self.logger.info(f"Starting text extraction for document {document.id}")
+            loop = asyncio.get_running_loop()
             
-            # Use optimized extraction for PDFs
-            if document.document_type.value == "pdf" and self.use_direct_docling:
-                complete_text = await self._extract_text_with_docling(document.file_path)
-            else:
-                complete_text = await self._extract_text_only(document.file_path)
+            # Reprocessing an identical file (retries, chunk parameter tuning) skips extraction
+            cache_path = None
+            complete_text = None
+            counted_paragraphs = None
+            if self._cache_dir is not None:
+                cache_path = await loop.run_in_executor(
+                    self._executor, self._extraction_cache_path, document.file_path
+                )
+                complete_text = await loop.run_in_executor(self._executor, self._read_cached_text, cache_path)
+                if complete_text is not None:
+                    self.logger.info(f"Reused cached text extraction for document {document.id}")
             
-            if not complete_text or len(complete_text.strip()) == 0:
+            if complete_text is None:
+                self.logger.info(f"Starting text extraction for document {document.id}")
+                
+                # Use optimized extraction for PDFs; large PDFs come back with their
+                # paragraphs already token-counted while extraction was running
+                if document.document_type.value == "pdf" and self.use_direct_docling:
+                    complete_text, counted_paragraphs = await self._extract_text_with_docling(document.file_path)
+                else:
+                    complete_text = await self._extract_text_only(document.file_path)
+                
+                if cache_path is not None and complete_text:
+                    await loop.run_in_executor(
+                        self._executor, self._write_cached_text, cache_path, complete_text
+                    )
+            
+            if not complete_text or complete_text.isspace():
                 raise DocumentProcessingError("No text content extracted from document")
             
             self.logger.info(f"Extracted {len(complete_text)} characters from document {document.id}")
@@ -110,7 +261,8 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
             # Create token-based chunks
             doc_chunks = await self._create_token_chunks(
                 document=document,
-                text=complete_text
+                text=complete_text,
+                counted_paragraphs=counted_paragraphs
             )
             
             self.logger.info(f"Created {len(doc_chunks)} chunks for document {document.id}")
@@ -120,19 +272,64 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
             self.logger.error(f"Failed to process document {document.filename}: {str(e)}")
             raise DocumentProcessingError(f"Failed to process document {document.filename}: {str(e)}")
 
-    async def _extract_text_with_docling(self, file_path: str) -> str:
-        """Fast text extraction using direct docling converter"""
+    def _extraction_cache_path(self, file_path: str) -> Path:
+        """Cache file for a document's text, keyed by file content and extraction configuration"""
+        with open(file_path, "rb") as f:
+            content_digest = hashlib.file_digest(f, "sha256").hexdigest()
+        
+        return self._cache_dir / f"{content_digest}-{self._extraction_config_digest}.txt"
+    
+    def _read_cached_text(self, cache_path: Path) -> Optional[str]:
+        """Load cached extracted text; any failure is a cache miss"""
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+            return None
+    
+    def _write_cached_text(self, cache_path: Path, text: str) -> None:
+        """Store extracted text atomically so concurrent readers never see a partial file"""
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write extraction cache {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    async def _extract_text_with_docling(
+            self,
+            file_path: str
+    ) -> Tuple[str, Optional[Tuple[List[str], List[int]]]]:
+        """
+        Fast text extraction using direct docling converter.
+        
+        Returns the text plus (paragraphs, token counts) when the paragraphs were
+        counted during parallel extraction, otherwise None.
+        """
         try:
             self.logger.info(f"Using optimized docling extraction for PDF: {file_path}")
             
-            # Convert document using optimized pipeline
-            conversion_result = self.document_converter.convert(file_path)
+            loop = asyncio.get_running_loop()
+            
+            # Large PDFs are split by page range and extracted in parallel processes
+            if self._page_pool is not None:
+                page_count = await loop.run_in_executor(self._executor, self._count_pdf_pages, file_path)
+                if page_count >= self.parallel_page_threshold:
+                    return await self._extract_pages_in_parallel(file_path, page_count)
+            
+            # Convert document using optimized pipeline, off the event loop
+            conversion_result = await loop.run_in_executor(
+                self._executor, self.document_converter.convert, file_path
+            )
             
             # Extract text from the first (and likely only) document
             if conversion_result.document:
-                complete_text = conversion_result.document.export_to_text()
+                complete_text = _document_text(conversion_result.document)
                 self.logger.debug(f"Docling extracted text length: {len(complete_text)}")
-                return complete_text.strip()
+                return complete_text, None
             else:
                 raise DocumentProcessingError("No document content found in conversion result")
                 
@@ -140,13 +337,85 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
             self.logger.error(f"Failed to extract text with docling from {file_path}: {str(e)}")
             # Fallback to spacy-layout
             self.logger.info("Falling back to spacy-layout extraction")
-            return await self._extract_text_only(file_path)
+            return await self._extract_text_only(file_path), None
+
+    async def _extract_pages_in_parallel(
+            self,
+            file_path: str,
+            page_count: int
+    ) -> Tuple[str, Tuple[List[str], List[int]]]:
+        """
+        Extract page ranges in worker processes and token-count them as they arrive.
+        
+        A producer hands finished ranges to a queue in page order while a consumer
+        counts each range's paragraphs on the thread pool, so tokenization of
+        early pages overlaps with extraction of later ones.
+        """
+        page_ranges = self._split_page_ranges(page_count, self.max_page_workers)
+        self.logger.info(f"Extracting {page_count} pages in {len(page_ranges)} parallel ranges")
+        
+        loop = asyncio.get_running_loop()
+        range_futures = [
+            loop.run_in_executor(
+                self._page_pool, _extract_page_range,
+                file_path, start_page, end_page, self.pdf_pipeline_options
+            )
+            for start_page, end_page in page_ranges
+        ]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        paragraphs: List[str] = []
+        paragraph_tokens: List[int] = []
+        
+        async def produce() -> None:
+            try:
+                for range_future in range_futures:
+                    await queue.put(await range_future)
+            finally:
+                await queue.put(None)
+        
+        async def consume() -> None:
+            while (range_text := await queue.get()) is not None:
+                if not range_text:
+                    continue
+                range_paragraphs = self._splitter.split_paragraphs(range_text)
+                range_tokens = await loop.run_in_executor(
+                    self._executor, self.token_service.count_tokens_batch, range_paragraphs
+                )
+                paragraphs.extend(range_paragraphs)
+                paragraph_tokens.extend(range_tokens)
+        
+        await asyncio.gather(produce(), consume())
+        
+        complete_text = "\n\n".join(paragraphs)
+        if not complete_text:
+            raise DocumentProcessingError("No document content found in conversion result")
+        self.logger.debug(f"Docling extracted text length: {len(complete_text)}")
+        return complete_text, (paragraphs, paragraph_tokens)
+
+    @staticmethod
+    def _count_pdf_pages(file_path: str) -> int:
+        """Read the PDF page count without parsing page content"""
+        pdf = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    @staticmethod
+    def _split_page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+        """Split pages 1..page_count into at most `parts` contiguous inclusive ranges"""
+        pages_per_range = -(-page_count // max(1, parts))
+        return [
+            (start_page, min(start_page + pages_per_range - 1, page_count))
+            for start_page in range(1, page_count + 1, pages_per_range)
+        ]
 
     async def _extract_text_only(self, file_path: str) -> str:
         """Extract only text content from document using spaCy Layout"""
         try:
-            # Process document with spaCy Layout
-            doc = self.layout(file_path)
+            # Process document with spaCy Layout off the event loop
+            loop = asyncio.get_running_loop()
+            doc = await loop.run_in_executor(self._executor, self.layout, file_path)
             # Simply return the full text - no complex structure extraction
             complete_text = doc.text.strip()
             self.logger.debug(f"SpaCy Layout text length: {len(complete_text)}")
@@ -160,243 +429,50 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
     async def _create_token_chunks(
             self,
             document: Document,
-            text: str
+            text: str,
+            counted_paragraphs: Optional[Tuple[List[str], List[int]]] = None
     ) -> List[DocumentChunk]:
         """Create chunks based on token count using recursive approach"""
         try:
-            chunks = []
-            # Split text into chunks using recursive token-based splitting
-            text_chunks = await self._recursive_token_split(text)
+            chunk_specs = []
+            # Document-level metadata is the same for every chunk; build it once
+            base_metadata = {
+                "document_filename": document.original_filename,
+                "document_type": document.document_type.value,
+                "processing_method": "optimized_token_chunking"
+            }
+            # Split text into chunks using recursive token-based splitting and count the
+            # kept chunks; both are CPU-bound tokenizer work, so run them off the event loop
+            loop = asyncio.get_running_loop()
+            paragraphs, paragraph_tokens = counted_paragraphs or (None, None)
+            chunk_records = await loop.run_in_executor(
+                self._executor, self._splitter.split_into_records, text, paragraphs, paragraph_tokens
+            )
             
-            for i, chunk_text in enumerate(text_chunks):
-                if len(chunk_text.strip()) < self.min_chunk_size:
-                    continue
-                
-                # Calculate token count for this chunk
-                token_count = self.token_service.count_tokens(chunk_text)
-                
-                # Create chunk with basic metadata
-                chunk = DocumentChunk.create(
-                    document_id=document.id,
-                    content=chunk_text.strip(),
-                    chunk_index=i,
-                    metadata={
-                        "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
+            for i, chunk_text, token_count in chunk_records:
+                # Collect chunk spec with basic metadata
+                chunk_specs.append({
+                    "content": chunk_text,
+                    "chunk_index": i,
+                    "metadata": {
+                        **base_metadata,
                         "chunk_token_count": token_count,
-                        "chunk_char_count": len(chunk_text),
-                        "processing_method": "optimized_token_chunking"
+                        "chunk_char_count": len(chunk_text)
                     }
-                )
-                chunks.append(chunk)
+                })
             
-            return chunks
+            return DocumentChunk.create_many(document.id, chunk_specs)
             
         except Exception as e:
             self.logger.error(f"Failed to create chunks: {str(e)}")
             raise DocumentProcessingError(f"Chunk creation failed: {str(e)}")
 
-    # Keep all your existing methods for chunking
-    async def _recursive_token_split(self, text: str) -> List[str]:
-        """Recursively split text based on token count"""
-        try:
-            # Check if text fits in one chunk
-            token_count = self.token_service.count_tokens(text)
-            if token_count <= self.chunk_size:
-                return [text]
-            
-            # Text is too large, need to split
-            chunks = []
-            
-            # Try splitting by paragraphs first
-            paragraphs = text.split('\n\n')
-            if len(paragraphs) > 1:
-                current_chunk = ""
-                current_tokens = 0
-                
-                for paragraph in paragraphs:
-                    paragraph = paragraph.strip()
-                    if not paragraph:
-                        continue
-                    
-                    para_tokens = self.token_service.count_tokens(paragraph)
-                    
-                    # If single paragraph is too large, split it further
-                    if para_tokens > self.chunk_size:
-                        # Save current chunk if it has content
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                            current_chunk = ""
-                            current_tokens = 0
-                        
-                        # Recursively split the large paragraph
-                        para_chunks = await self._split_large_paragraph(paragraph)
-                        chunks.extend(para_chunks)
-                    else:
-                        # Check if adding this paragraph exceeds chunk size
-                        if current_tokens + para_tokens > self.chunk_size and current_chunk:
-                            # Save current chunk and start new one
-                            chunks.append(current_chunk.strip())
-                            current_chunk = paragraph
-                            current_tokens = para_tokens
-                        else:
-                            # Add to current chunk
-                            if current_chunk:
-                                current_chunk += "\n\n" + paragraph
-                                current_tokens += para_tokens
-                            else:
-                                current_chunk = paragraph
-                                current_tokens = para_tokens
-                
-                # Add remaining chunk
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-            else:
-                # Single paragraph, split by sentences
-                chunks = await self._split_large_paragraph(text)
-            
-            # Apply overlap if we have multiple chunks
-            if len(chunks) > 1 and self.chunk_overlap > 0:
-                chunks = await self._apply_overlap(chunks)
-            
-            return chunks
-            
-        except Exception as e:
-            self.logger.error(f"Failed in recursive token split: {str(e)}")
-            # Fallback to simple character-based splitting
-            return self._fallback_character_split(text)
-    
-    async def _split_large_paragraph(self, paragraph: str) -> List[str]:
-        """Split a large paragraph by sentences"""
-        try:
-            # Split by sentences using spaCy
-            doc = self.nlp(paragraph)
-            sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
-            
-            if not sentences:
-                return [paragraph]
-            
-            chunks = []
-            current_chunk = ""
-            current_tokens = 0
-            
-            for sentence in sentences:
-                sent_tokens = self.token_service.count_tokens(sentence)
-                
-                # If single sentence is too large, split by words
-                if sent_tokens > self.chunk_size:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = ""
-                        current_tokens = 0
-                    
-                    # Split sentence by words
-                    word_chunks = await self._split_by_words(sentence)
-                    chunks.extend(word_chunks)
-                else:
-                    if current_tokens + sent_tokens > self.chunk_size and current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = sentence
-                        current_tokens = sent_tokens
-                    else:
-                        if current_chunk:
-                            current_chunk += " " + sentence
-                            current_tokens += sent_tokens
-                        else:
-                            current_chunk = sentence
-                            current_tokens = sent_tokens
-            
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
-            
-            return chunks
-            
-        except Exception as e:
-            self.logger.error(f"Failed to split paragraph: {str(e)}")
-            return [paragraph]
-    
-    async def _split_by_words(self, text: str) -> List[str]:
-        """Split text by words when sentences are too large"""
-        words = text.split()
-        chunks = []
-        current_chunk = ""
-        
-        for word in words:
-            test_chunk = f"{current_chunk} {word}".strip()
-            test_tokens = self.token_service.count_tokens(test_chunk)
-            
-            if test_tokens > self.chunk_size and current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = word
-            else:
-                current_chunk = test_chunk
-        
-        if current_chunk:
-            chunks.append(current_chunk)
-        
-        return chunks
-    
-    async def _apply_overlap(self, chunks: List[str]) -> List[str]:
-        """Apply overlap between chunks"""
-        if len(chunks) <= 1:
-            return chunks
-        
-        overlapped_chunks = []
-        
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                overlapped_chunks.append(chunk)
-                continue
-            
-            # Get overlap from previous chunk
-            prev_chunk = chunks[i - 1]
-            overlap_text = await self._get_overlap_text(prev_chunk, self.chunk_overlap)
-            
-            # Combine overlap with current chunk
-            if overlap_text:
-                overlapped_chunk = f"{overlap_text} {chunk}"
-                overlapped_chunks.append(overlapped_chunk)
-            else:
-                overlapped_chunks.append(chunk)
-        
-        return overlapped_chunks
-    
-    async def _get_overlap_text(self, text: str, target_tokens: int) -> str:
-        """Get the last N tokens worth of text for overlap"""
-        try:
-            # Split into words and work backwards
-            words = text.split()
-            overlap_words = []
-            current_tokens = 0
-            
-            for word in reversed(words):
-                test_text = " ".join([word] + overlap_words)
-                test_tokens = self.token_service.count_tokens(test_text)
-                
-                if test_tokens > target_tokens:
-                    break
-                
-                overlap_words.insert(0, word)
-                current_tokens = test_tokens
-            
-            return " ".join(overlap_words)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get overlap text: {str(e)}")
-            return ""
-    
-    def _fallback_character_split(self, text: str) -> List[str]:
-        """Fallback method for splitting text by characters"""
-        chunk_size_chars = self.chunk_size * 4  # Rough estimate: 1 token ≈ 4 chars
-        chunks = []
-        
-        for i in range(0, len(text), chunk_size_chars):
-            chunk = text[i:i + chunk_size_chars]
-            if chunk.strip():
-                chunks.append(chunk.strip())
-        
-        return chunks
-
     def get_supported_types(self) -> List[str]:
         """Return list of supported document types"""
         return self.supported_types.copy()
+
+    def close(self) -> None:
+        """Shut down the page extraction worker processes, if any"""
+        if self._page_pool is not None:
+            self._page_pool.shutdown(cancel_futures=True)
+            self._page_pool = None
@@ -1,20 +1,37 @@
+import os
+import sys
+import json
+import contextlib
+import hashlib
+import functools
+import threading
+import asyncio
+import multiprocessing
 import spacy
 from spacy_layout import spaCyLayout
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, AsyncIterator
 from ...core.ports.document_processor import DocumentProcessor
 from ...core.domain.entities.document import Document
 from ...core.domain.entities.document_chunk import DocumentChunk
 from ...core.domain.exceptions import DocumentProcessingError, InvalidDocumentTypeError
 from ...core.ports.token_service import TokenService
+from .token_splitting import TokenTextSplitter
 
 
 class SpacyModelLoader:
     """Responsible for loading spaCy models with fallback strategy"""
     
-    def __init__(self, logger: logging.Logger):
+    # Token annotation components; chunking only ever needs sentence boundaries
+    ANNOTATION_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+    
+    def __init__(self, logger: logging.Logger, senter_only: bool = True):
         self._logger = logger
+        self._senter_only = senter_only
+        # Excluded components are never deserialized, unlike disabled ones
+        self._exclude = self.ANNOTATION_COMPONENTS if senter_only else []
     
     def load(self, model_name: str, local_model_path: Optional[Path] = None) -> spacy.Language:
         """
@@ -27,37 +44,45 @@ class SpacyModelLoader:
             model_name: Name of the spaCy model
             local_model_path: Optional path to local model directory
             
+        With senter_only, annotation components are excluded and a rule-based
+        sentencizer is added so that .sents still works.
+        
         Returns:
             Loaded spaCy Language model
             
         Raises:
             DocumentProcessingError: If all loading attempts fail
         """
-        # Try loading from local path first
-        if local_model_path:
+        # Probe each source before loading so the common misses (no local copy,
+        # package not installed) don't go through raise/catch
+        if local_model_path and (local_model_path / model_name).exists():
             try:
                 nlp = self._load_from_local_path(local_model_path, model_name)
-                self._logger.info(f"Successfully loaded local spaCy model from: {local_model_path}")
-                return nlp
+                self._logger.info("Successfully loaded local spaCy model from: %s", local_model_path)
+                return self._ensure_sentencizer(nlp)
             except Exception as e:
-                self._logger.warning(f"Failed to load local model from {local_model_path}: {e}")
+                self._logger.warning("Failed to load local model from %s: %s", local_model_path, e)
         
         # Try loading system-installed model
-        try:
-            nlp = spacy.load(model_name)
-            self._logger.info(f"Successfully loaded system spaCy model: {model_name}")
-            return nlp
-        except OSError as e:
-            self._logger.warning(f"Could not load system model {model_name}: {e}")
+        if spacy.util.is_package(model_name):
+            try:
+                nlp = spacy.load(model_name, exclude=self._exclude)
+                self._logger.info("Successfully loaded system spaCy model: %s", model_name)
+                return self._ensure_sentencizer(nlp)
+            except OSError as e:
+                self._logger.warning("Could not load system model %s: %s", model_name, e)
+        else:
+            self._logger.warning("spaCy model %s is not installed", model_name)
         
         # Fallback to blank model
         try:
             nlp = spacy.blank("en")
             self._logger.warning(
-                f"Using blank English model as fallback. "
-                f"Install {model_name} for better performance: python -m spacy download {model_name}"
+                "Using blank English model as fallback. "
+                "Install %s for better performance: python -m spacy download %s",
+                model_name, model_name
             )
-            return nlp
+            return self._ensure_sentencizer(nlp)
         except Exception as e:
             error_msg = f"Failed to initialize any spaCy model: {e}"
             self._logger.error(error_msg)
@@ -70,7 +95,59 @@ class SpacyModelLoader:
         if not model_path.exists():
             raise FileNotFoundError(f"Local model path does not exist: {model_path}")
         
-        return spacy.load(model_path)
+        return spacy.load(model_path, exclude=self._exclude)
+    
+    def _ensure_sentencizer(self, nlp: spacy.Language) -> spacy.Language:
+        """Add a rule-based sentencizer when senter_only left no sentence boundary component"""
+        if self._senter_only and not (nlp.has_pipe("sentencizer") or "senter" in nlp.pipe_names):
+            nlp.add_pipe("sentencizer")
+        return nlp
+
+
+# Serializes first loads so concurrent processor construction deserializes a model once
+_model_load_lock = threading.Lock()
+
+
+def _local_model_mtime_ns(model_name: str, local_model_path: Optional[Path]) -> Optional[int]:
+    """Modification time of the local model directory, or None when there is none"""
+    if not local_model_path:
+        return None
+    try:
+        return (local_model_path / model_name).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_spacy_model_cached(
+        model_name: str,
+        local_model_path: Optional[Path],
+        senter_only: bool,
+        local_model_mtime_ns: Optional[int]
+) -> spacy.Language:
+    """Load a spaCy model; the mtime argument only keys the cache"""
+    return SpacyModelLoader(logging.getLogger(__name__), senter_only=senter_only).load(
+        model_name, local_model_path
+    )
+
+
+def load_spacy_model(
+        model_name: str,
+        local_model_path: Optional[Path] = None,
+        senter_only: bool = True
+) -> spacy.Language:
+    """
+    Load a spaCy model once per process and configuration.
+
+    Instances of every spaCy-based processor share the returned pipeline, which
+    is only read during extraction and chunking. A processor built before workers fork (e.g. gunicorn --preload)
+    lets the forked workers share the model's memory pages copy-on-write.
+    The cache is keyed on the local model's mtime, so a replaced model on disk
+    is picked up by the next processor while repeat constructions cost one stat.
+    """
+    mtime_ns = _local_model_mtime_ns(model_name, local_model_path)
+    with _model_load_lock:
+        return _load_spacy_model_cached(model_name, local_model_path, senter_only, mtime_ns)
 
 
 class SimpleSpacyLayoutProcessor(DocumentProcessor):
@@ -81,6 +158,13 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
     DEFAULT_CHUNK_SIZE = 1000
     DEFAULT_CHUNK_OVERLAP = 200
     DEFAULT_MIN_CHUNK_SIZE = 100
+    DEFAULT_CACHE_MAX_BYTES = 1 << 30
+
+    # Chunks are built and emitted this many at a time when streaming
+    _CHUNK_EMIT_BATCH_SIZE = 32
+    # Eviction trims the cache to this fraction of cache_max_bytes, so a full
+    # cache is not rescanned on every write
+    _CACHE_TRIM_RATIO = 0.9
 
     def __init__(
             self,
@@ -90,6 +174,14 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
             chunk_size: int = DEFAULT_CHUNK_SIZE,
             chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
             min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE,
+            use_spacy_sentences: bool = False,
+            sentence_batch_size: int = 64,
+            parallel_sentencize: bool = sys.platform != "win32",
+            executor: Optional[Executor] = None,
+            senter_only: bool = True,
+            cache_dir: Optional[str] = None,
+            cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+            split_workers: int = 1,
     ):
         """
         Initialize the SpaCy Layout processor
@@ -101,6 +193,17 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
             chunk_size: Maximum size of text chunks
             chunk_overlap: Overlap between consecutive chunks
             min_chunk_size: Minimum acceptable chunk size
+            use_spacy_sentences: Fall back to spaCy's sentencizer for paragraphs the regex cannot split
+            sentence_batch_size: Paragraphs per nlp.pipe batch when use_spacy_sentences is set
+            parallel_sentencize: Spread large nlp.pipe batches over worker processes
+                (off by default on Windows, where process start-up is too costly)
+            executor: Pool for blocking extraction and chunking; defaults to the event loop's executor
+            senter_only: Load the model without tagger/parser/NER, keeping only sentence boundaries
+            cache_dir: Directory for results cached by file content; None disables caching
+            cache_max_bytes: Size the cache directory is trimmed to once writes may have
+                outgrown it, evicting the least recently used results first
+            split_workers: Worker processes for splitting text into chunks; 1 keeps
+                splitting on the executor (workers count tokens with tiktoken)
         """
         self.logger = logging.getLogger(__name__)
         self.token_service = token_service
@@ -110,12 +213,73 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
-
-        # Load spacy model
-        spacy_model_loader = SpacyModelLoader(self.logger)
+        self.use_spacy_sentences = use_spacy_sentences
+        self.sentence_batch_size = sentence_batch_size
+        self.parallel_sentencize = parallel_sentencize
+        self._executor = executor
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache_max_bytes = cache_max_bytes
+        # Running estimate of the cache directory's size, so the directory is only
+        # scanned once writes may have pushed it past cache_max_bytes; None until
+        # the first write, which scans it
+        self._cache_bytes_estimate: Optional[int] = None
+        self._cache_bytes_lock = threading.Lock()
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Load spacy model (shared across processor instances)
         local_path = Path(local_model_path) if local_model_path else self.DEFAULT_LOCAL_MODEL_PATH
 
-        self.nlp = spacy_model_loader.load(spacy_model, local_path)
+        self.nlp = load_spacy_model(spacy_model, local_path, senter_only)
+        self._splitter = TokenTextSplitter(
+            token_service,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            min_chunk_size=min_chunk_size,
+            use_spacy_sentences=use_spacy_sentences,
+            spacy_lang=self.nlp.lang,
+            sentence_batch_size=sentence_batch_size,
+            parallel_sentencize=parallel_sentencize
+        )
+
+        # Cached results depend on the loaded model (the extracted text and layout blocks)
+        # and on every chunking parameter, so all of them are part of the cache key
+        cache_config = (
+            spacy_model,
+            senter_only,
+            self.nlp.meta.get("name"),
+            self.nlp.meta.get("version"),
+            tuple(self.nlp.pipe_names),
+            chunk_size,
+            chunk_overlap,
+            min_chunk_size,
+            use_spacy_sentences,
+            token_service.get_model_info().get("encoding_name"),
+        )
+        self._cache_config_digest = hashlib.sha256(repr(cache_config).encode()).hexdigest()[:16]
+
+        # Splitting is CPU-bound Python work that holds the GIL, so it can be spread over
+        # processes. Workers are started fresh (not forked from this multi-threaded process)
+        # and only build a tokenizer and splitter; they never start nested sentencizer pools.
+        self._split_pool = None
+        if split_workers > 1:
+            self._split_pool = ProcessPoolExecutor(
+                max_workers=split_workers,
+                mp_context=worker_mp_context(),
+                initializer=_init_split_worker,
+                initargs=(
+                    token_service.get_model_info().get("model_name"),
+                    {
+                        "chunk_size": chunk_size,
+                        "chunk_overlap": chunk_overlap,
+                        "min_chunk_size": min_chunk_size,
+                        "use_spacy_sentences": use_spacy_sentences,
+                        "spacy_lang": self.nlp.lang,
+                        "sentence_batch_size": sentence_batch_size,
+                        "parallel_sentencize": False,
+                    },
+                )
+            )
 
         # try:
         #     # Load spaCy model
@@ -130,8 +294,9 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
         self.layout = spaCyLayout(self.nlp)
         self.supported_types = ["pdf", "docx", "doc"]
         self.logger.info(
-            f"Initialized SimpleSpacyLayoutProcessor with chunk_size={chunk_size}, "
-            f"chunk_overlap={chunk_overlap}, min_chunk_size={min_chunk_size}"
+            "Initialized SimpleSpacyLayoutProcessor with chunk_size=%d, "
+            "chunk_overlap=%d, min_chunk_size=%d",
+            chunk_size, chunk_overlap, min_chunk_size
         )
 
     def _validate_chunk_parameters(
@@ -162,297 +327,275 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
 
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """Process a document and return token-based chunks and complete text"""
+        complete_text, chunk_records = await self._load_chunk_records(document)
+
+        doc_chunks = await self._create_token_chunks(document, chunk_records)
+        self.logger.info("Created %d chunks for document %s", len(doc_chunks), document.id)
+
+        return doc_chunks, complete_text
+
+    async def iter_chunks(self, document: Document) -> AsyncIterator[DocumentChunk]:
+        """Yield token-based chunks in batches as they are built"""
+        _, chunk_records = await self._load_chunk_records(document)
+
+        async for chunk in self._iter_token_chunks(document, chunk_records):
+            yield chunk
+
+    async def _load_chunk_records(self, document: Document) -> Tuple[str, List[Tuple[int, str, int]]]:
+        """Extract the document text and split it into chunk records, reusing cached results"""
         try:
             if document.document_type.value not in self.supported_types:
                 raise InvalidDocumentTypeError(
                     f"Document type {document.document_type.value} not supported"
                 )
 
-            self.logger.info(f"Starting text extraction for document {document.id}")
+            loop = asyncio.get_running_loop()
+
+            # Re-uploaded files with the same content and chunking config skip all CPU work
+            cache_path = None
+            if self._cache_dir is not None:
+                cache_path = await loop.run_in_executor(
+                    self._executor, self._result_cache_path, document.file_path
+                )
+                cached = await loop.run_in_executor(self._executor, self._read_cached_result, cache_path)
+                if cached is not None:
+                    complete_text, chunk_records = cached
+                    self.logger.info("Reused %d cached chunks for document %s", len(chunk_records), document.id)
+                    return complete_text, chunk_records
+
+            self.logger.info("Starting text extraction for document %s", document.id)
 
             # Extract text using spaCy Layout (simplified)
-            complete_text = await self._extract_text_only(document.file_path)
+            complete_text, layout_paragraphs = await self._extract_text_only(document.file_path)
 
-            if not complete_text or len(complete_text.strip()) == 0:
+            if not complete_text or complete_text.isspace():
                 raise DocumentProcessingError("No text content extracted from document")
 
-            self.logger.info(f"Extracted {len(complete_text)} characters from document {document.id}")
+            self.logger.info("Extracted %d characters from document %s", len(complete_text), document.id)
 
-            # Create token-based chunks
-            doc_chunks = await self._create_token_chunks(
-                document=document,
-                text=complete_text
-            )
+            # Split text into token-based chunk records
+            chunk_records = await self._split_text_into_records(complete_text, layout_paragraphs)
 
-            self.logger.info(f"Created {len(doc_chunks)} chunks for document {document.id}")
+            if cache_path is not None:
+                await loop.run_in_executor(
+                    self._executor, self._write_cached_result, cache_path, complete_text, chunk_records
+                )
 
-            return doc_chunks, complete_text
+            return complete_text, chunk_records
 
         except Exception as e:
-            self.logger.error(f"Failed to process document {document.filename}: {str(e)}")
+            self.logger.error("Failed to process document %s: %s", document.filename, e)
             raise DocumentProcessingError(f"Failed to process document {document.filename}: {str(e)}")
 
-    async def _extract_text_only(self, file_path: str) -> str:
-        """Extract only text content from document using spaCy Layout"""
+    async def _extract_text_only(self, file_path: str) -> Tuple[str, Optional[List[str]]]:
+        """Extract text content and layout paragraphs from document using spaCy Layout"""
         try:
-            # Process document with spaCy Layout
-            doc = self.layout(file_path)
-
-            # Simply return the full text - no complex structure extraction
-            complete_text = doc.text.strip()
+            # Process document with spaCy Layout off the event loop
+            loop = asyncio.get_running_loop()
+            complete_text, paragraphs = await loop.run_in_executor(
+                self._executor, self._layout_text_and_paragraphs, file_path
+            )
 
-            self.logger.debug(f"Raw text length: {len(complete_text)}")
+            self.logger.debug("Raw text length: %d", len(complete_text))
 
-            return complete_text
+            return complete_text, paragraphs
 
         except Exception as e:
-            self.logger.error(f"Failed to extract text from {file_path}: {str(e)}")
+            self.logger.error("Failed to extract text from %s: %s", file_path, e)
             raise DocumentProcessingError(f"Text extraction failed: {str(e)}")
 
+    def _layout_text_and_paragraphs(self, file_path: str) -> Tuple[str, Optional[List[str]]]:
+        """
+        Run spaCy Layout and return the full text plus its layout block texts.
+
+        The document text is the layout spans joined by the layout separator, so
+        the spans are already the paragraphs the splitter would find; reusing them
+        skips re-scanning the text. None when the layout produced no span group.
+        """
+        doc = self.layout(file_path)
+        complete_text = doc.text.strip()
+
+        spans = doc.spans.get(self.layout.attrs.span_group)
+        if not spans:
+            return complete_text, None
+
+        paragraphs = [p for p in (span.text.strip() for span in spans) if p]
+        return complete_text, paragraphs
+
     async def _create_token_chunks(
             self,
             document: Document,
-            text: str
+            chunk_records: List[Tuple[int, str, int]]
     ) -> List[DocumentChunk]:
-        """Create chunks based on token count using recursive approach"""
+        """Create all document chunks at once, for callers that need the full list"""
+        return [chunk async for chunk in self._iter_token_chunks(document, chunk_records)]
+
+    async def _split_text_into_records(
+            self,
+            text: str,
+            paragraphs: Optional[List[str]] = None
+    ) -> List[Tuple[int, str, int]]:
+        """Create chunk records based on token count using recursive approach"""
         try:
-            chunks = []
-
-            # Split text into chunks using recursive token-based splitting
-            text_chunks = await self._recursive_token_split(text)
-
-            for i, chunk_text in enumerate(text_chunks):
-                if len(chunk_text.strip()) < self.min_chunk_size:
-                    continue
-
-                # Calculate token count for this chunk
-                token_count = self.token_service.count_tokens(chunk_text)
-
-                # Create chunk with basic metadata
-                chunk = DocumentChunk.create(
-                    document_id=document.id,
-                    content=chunk_text.strip(),
-                    chunk_index=i,
-                    metadata={
-                        "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
-                        "chunk_token_count": token_count,
-                        "chunk_char_count": len(chunk_text),
-                        "processing_method": "simple_token_chunking"
-                    }
+            # Splitting and counting is CPU-bound tokenizer work, so run it off the event loop
+            loop = asyncio.get_running_loop()
+            if self._split_pool is not None:
+                return await loop.run_in_executor(
+                    self._split_pool, _split_records_worker, text, paragraphs
                 )
-
-                chunks.append(chunk)
-
-            return chunks
+            return await loop.run_in_executor(
+                self._executor, self._splitter.split_into_records, text, paragraphs
+            )
 
         except Exception as e:
-            self.logger.error(f"Failed to create chunks: {str(e)}")
+            self.logger.error("Failed to create chunks: %s", e)
             raise DocumentProcessingError(f"Chunk creation failed: {str(e)}")
 
-    async def _recursive_token_split(self, text: str) -> List[str]:
-        """Recursively split text based on token count"""
-        try:
-            # Check if text fits in one chunk
-            token_count = self.token_service.count_tokens(text)
-
-            if token_count <= self.chunk_size:
-                return [text]
-
-            # Text is too large, need to split
-            chunks = []
-
-            # Try splitting by paragraphs first
-            paragraphs = text.split('\n\n')
-
-            if len(paragraphs) > 1:
-                current_chunk = ""
-                current_tokens = 0
-
-                for paragraph in paragraphs:
-                    paragraph = paragraph.strip()
-                    if not paragraph:
-                        continue
-
-                    para_tokens = self.token_service.count_tokens(paragraph)
-
-                    # If single paragraph is too large, split it further
-                    if para_tokens > self.chunk_size:
-                        # Save current chunk if it has content
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                            current_chunk = ""
-                            current_tokens = 0
-
-                        # Recursively split the large paragraph
-                        para_chunks = await self._split_large_paragraph(paragraph)
-                        chunks.extend(para_chunks)
-                    else:
-                        # Check if adding this paragraph exceeds chunk size
-                        if current_tokens + para_tokens > self.chunk_size and current_chunk:
-                            # Save current chunk and start new one
-                            chunks.append(current_chunk.strip())
-                            current_chunk = paragraph
-                            current_tokens = para_tokens
-                        else:
-                            # Add to current chunk
-                            if current_chunk:
-                                current_chunk += "\n\n" + paragraph
-                                current_tokens += para_tokens
-                            else:
-                                current_chunk = paragraph
-                                current_tokens = para_tokens
-
-                # Add remaining chunk
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-
-            else:
-                # Single paragraph, split by sentences
-                chunks = await self._split_large_paragraph(text)
-
-            # Apply overlap if we have multiple chunks
-            if len(chunks) > 1 and self.chunk_overlap > 0:
-                chunks = await self._apply_overlap(chunks)
-
-            return chunks
-
-        except Exception as e:
-            self.logger.error(f"Failed in recursive token split: {str(e)}")
-            # Fallback to simple character-based splitting
-            return self._fallback_character_split(text)
-
-    async def _split_large_paragraph(self, paragraph: str) -> List[str]:
-        """Split a large paragraph by sentences"""
-        try:
-            # Split by sentences using spaCy
-            doc = self.nlp(paragraph)
-            sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
-
-            if not sentences:
-                return [paragraph]
-
-            chunks = []
-            current_chunk = ""
-            current_tokens = 0
-
-            for sentence in sentences:
-                sent_tokens = self.token_service.count_tokens(sentence)
-
-                # If single sentence is too large, split by words
-                if sent_tokens > self.chunk_size:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = ""
-                        current_tokens = 0
-
-                    # Split sentence by words
-                    word_chunks = await self._split_by_words(sentence)
-                    chunks.extend(word_chunks)
-                else:
-                    if current_tokens + sent_tokens > self.chunk_size and current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = sentence
-                        current_tokens = sent_tokens
-                    else:
-                        if current_chunk:
-                            current_chunk += " " + sentence
-                            current_tokens += sent_tokens
-                        else:
-                            current_chunk = sentence
-                            current_tokens = sent_tokens
-
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
-
-            return chunks
-
-        except Exception as e:
-            self.logger.error(f"Failed to split paragraph: {str(e)}")
-            return [paragraph]
-
-    async def _split_by_words(self, text: str) -> List[str]:
-        """Split text by words when sentences are too large"""
-        words = text.split()
-        chunks = []
-        current_chunk = ""
+    async def _iter_token_chunks(
+            self,
+            document: Document,
+            chunk_records: List[Tuple[int, str, int]]
+    ) -> AsyncIterator[DocumentChunk]:
+        """Build document chunks with per-document metadata from chunk records, one batch at a time"""
+        # Document-level metadata is the same for every chunk; build it once
+        base_metadata = {
+            "document_filename": document.original_filename,
+            "document_type": document.document_type.value,
+            "processing_method": "simple_token_chunking"
+        }
+
+        batch_size = self._CHUNK_EMIT_BATCH_SIZE
+        for batch_start in range(0, len(chunk_records), batch_size):
+            chunk_specs = [
+                {
+                    "content": chunk_text,
+                    "chunk_index": i,
+                    "metadata": {
+                        **base_metadata,
+                        "chunk_token_count": token_count,
+                        "chunk_char_count": len(chunk_text)
+                    }
+                }
+                for i, chunk_text, token_count in chunk_records[batch_start:batch_start + batch_size]
+            ]
 
-        for word in words:
-            test_chunk = f"{current_chunk} {word}".strip()
-            test_tokens = self.token_service.count_tokens(test_chunk)
+            for chunk in DocumentChunk.create_many(document.id, chunk_specs):
+                yield chunk
 
-            if test_tokens > self.chunk_size and current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = word
-            else:
-                current_chunk = test_chunk
+    def _result_cache_path(self, file_path: str) -> Path:
+        """Cache file for a document, keyed by file content and the chunking configuration"""
+        with open(file_path, "rb") as f:
+            content_digest = hashlib.file_digest(f, "sha256").hexdigest()
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        return self._cache_dir / f"{content_digest}-{self._cache_config_digest}.json"
 
-        return chunks
+    def _read_cached_result(self, cache_path: Path) -> Optional[Tuple[str, List[Tuple[int, str, int]]]]:
+        """Load a cached (complete_text, chunk_records) pair; any failure is a cache miss"""
+        try:
+            with open(cache_path, "rb") as f:
+                complete_text, records = json.load(f)
+            result = complete_text, [tuple(record) for record in records]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable result cache %s: %s", cache_path, e)
+            return None
 
-    async def _apply_overlap(self, chunks: List[str]) -> List[str]:
-        """Apply overlap between chunks"""
-        if len(chunks) <= 1:
-            return chunks
+        # Hits refresh the mtime, so eviction drops the least recently used results
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return result
 
-        overlapped_chunks = []
+    def _write_cached_result(
+            self,
+            cache_path: Path,
+            complete_text: str,
+            chunk_records: List[Tuple[int, str, int]]
+    ) -> None:
+        """Store a result atomically so concurrent readers never see a partial file"""
+        # Plain JSON (records as lists) so a shared cache directory can't inject code
+        payload = json.dumps([complete_text, chunk_records], ensure_ascii=False).encode("utf-8")
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning("Failed to write result cache %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._cache_bytes_lock:
+            if self._cache_bytes_estimate is not None:
+                self._cache_bytes_estimate += len(payload)
+                if self._cache_bytes_estimate <= self._cache_max_bytes:
+                    return
+            self._cache_bytes_estimate = self._evict_cached_results()
+
+    def _evict_cached_results(self) -> int:
+        """
+        Delete the oldest cached results by mtime once the cache outgrows cache_max_bytes.
 
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                overlapped_chunks.append(chunk)
+        Returns the size of the results left in the cache directory.
+        """
+        entries = []
+        total_bytes = 0
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted concurrently by another worker
                 continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_bytes += stat.st_size
 
-            # Get overlap from previous chunk
-            prev_chunk = chunks[i - 1]
-            overlap_text = await self._get_overlap_text(prev_chunk, self.chunk_overlap)
+        if total_bytes <= self._cache_max_bytes:
+            return total_bytes
 
-            # Combine overlap with current chunk
-            if overlap_text:
-                overlapped_chunk = f"{overlap_text} {chunk}"
-                overlapped_chunks.append(overlapped_chunk)
-            else:
-                overlapped_chunks.append(chunk)
+        target_bytes = int(self._cache_max_bytes * self._CACHE_TRIM_RATIO)
+        entries.sort()
+        for _mtime_ns, size, path in entries:
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            if total_bytes <= target_bytes:
+                break
+        return total_bytes
 
-        return overlapped_chunks
+    def get_supported_types(self) -> List[str]:
+        """Return list of supported document types"""
+        return self.supported_types.copy()
 
-    async def _get_overlap_text(self, text: str, target_tokens: int) -> str:
-        """Get the last N tokens worth of text for overlap"""
-        try:
-            # Split into words and work backwards
-            words = text.split()
-            overlap_words = []
-            current_tokens = 0
+    def close(self) -> None:
+        """Shut down the split worker processes, if any"""
+        if self._split_pool is not None:
+            self._split_pool.shutdown(cancel_futures=True)
+            self._split_pool = None
 
-            for word in reversed(words):
-                test_text = " ".join([word] + overlap_words)
-                test_tokens = self.token_service.count_tokens(test_text)
 
-                if test_tokens > target_tokens:
-                    break
+def worker_mp_context() -> multiprocessing.context.BaseContext:
+    """Start method for worker pools: forkserver where available, otherwise spawn"""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
 
-                overlap_words.insert(0, word)
-                current_tokens = test_tokens
 
-            return " ".join(overlap_words)
+# Splitter built once per split worker process by _init_split_worker
+_worker_splitter: Optional[TokenTextSplitter] = None
 
-        except Exception as e:
-            self.logger.error(f"Failed to get overlap text: {str(e)}")
-            return ""
 
-    def _fallback_character_split(self, text: str) -> List[str]:
-        """Fallback method for splitting text by characters"""
-        chunk_size_chars = self.chunk_size * 4  # Rough estimate: 1 token ≈ 4 chars
-        chunks = []
+def _init_split_worker(token_model: str, splitter_kwargs: Dict[str, Any]) -> None:
+    """
+    Build the tokenizer and splitter a split worker uses for every task.
 
-        for i in range(0, len(text), chunk_size_chars):
-            chunk = text[i:i + chunk_size_chars]
-            if chunk.strip():
-                chunks.append(chunk.strip())
+    Runs once per worker process. Only tokenizer and splitter state is
+    needed to split text, so no spaCy model or layout pipeline is loaded.
+    """
+    global _worker_splitter
+    from ..token_service.tiktoken_service import get_tiktoken_service
 
-        return chunks
+    _worker_splitter = TokenTextSplitter(get_tiktoken_service(token_model), **splitter_kwargs)
 
-    def get_supported_types(self) -> List[str]:
-        """Return list of supported document types"""
-        return self.supported_types.copy()
+
+def _split_records_worker(text: str, paragraphs: Optional[List[str]]) -> List[Tuple[int, str, int]]:
+    """Split text into chunk records inside a worker process; module-level so it can be pickled"""
+    return _worker_splitter.split_into_records(text, paragraphs)
@@ -1,9 +1,9 @@
-import spacy
 from spacy_layout import spaCyLayout
-from docling.document_converter import DocumentConverter
+from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+import functools
 import logging
 from typing import List, Dict, Any, Tuple, Optional
 from ...core.ports.document_processor import DocumentProcessor
@@ -11,6 +11,27 @@ from ...core.domain.entities.document import Document
 from ...core.domain.entities.document_chunk import DocumentChunk
 from ...core.domain.exceptions import DocumentProcessingError, InvalidDocumentTypeError
 from ...core.ports.token_service import TokenService
+from .simple_spacy_layout import SimpleSpacyLayoutProcessor, load_spacy_model
+
+
+@functools.lru_cache(maxsize=4)
+def _load_text_only_converter(pipeline_options_json: str) -> DocumentConverter:
+    """
+    Build a text-only docling converter once per process and pipeline configuration.
+
+    Keyed by the serialized options since PdfPipelineOptions isn't hashable.
+    The PDF pipeline is initialized up front so its model load happens when
+    the processor is built, not on the first document.
+    """
+    pipeline_options = PdfPipelineOptions.model_validate_json(pipeline_options_json)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
 
 class TextOnlyProcessor(DocumentProcessor):
     """Ultra-fast text-only processor for PDFs"""
@@ -29,14 +50,8 @@ class TextOnlyProcessor(DocumentProcessor):
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
         
-        try:
-            # Load spaCy model
-            self.nlp = spacy.load(spacy_model)
-            self.logger.info(f"Loaded spaCy model: {spacy_model}")
-        except OSError:
-            # Fallback to blank model if specific model not available
-            self.nlp = spacy.blank("en")
-            self.logger.warning(f"Could not load {spacy_model}, using blank English model")
+        # Load spaCy model (shared with every spaCy-based processor; falls back to a blank model)
+        self.nlp = load_spacy_model(spacy_model, SimpleSpacyLayoutProcessor.DEFAULT_LOCAL_MODEL_PATH)
         
         # Configure minimal PDF pipeline - TEXT ONLY
         self.pdf_pipeline_options = PdfPipelineOptions(
@@ -60,12 +75,8 @@ class TextOnlyProcessor(DocumentProcessor):
             }
         )
         
-        # Create text-only document converter
-        self.document_converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: self.pdf_pipeline_options
-            }
-        )
+        # Create text-only document converter (shared across processor instances)
+        self.document_converter = _load_text_only_converter(self.pdf_pipeline_options.model_dump_json())
         
         # Fallback spacy-layout for non-PDF files
         self.layout = spaCyLayout(self.nlp)
@@ -87,7 +98,7 @@ class TextOnlyProcessor(DocumentProcessor):
             else:
                 complete_text = await self._extract_text_with_spacy_layout(document.file_path)
             
-            if not complete_text or len(complete_text.strip()) == 0:
+            if not complete_text or complete_text.isspace():
                 raise DocumentProcessingError("No text content extracted from document")
             
             self.logger.info(f"Extracted {len(complete_text)} characters from document {document.id}")
@@ -144,35 +155,41 @@ class TextOnlyProcessor(DocumentProcessor):
     ) -> List[DocumentChunk]:
         """Create chunks based on token count using recursive approach"""
         try:
-            chunks = []
+            chunk_specs = []
+            # Document-level metadata is the same for every chunk; build it once
+            base_metadata = {
+                "document_filename": document.original_filename,
+                "document_type": document.document_type.value,
+                "processing_method": "simple_token_chunking"
+            }
 
             # Split text into chunks using recursive token-based splitting
             text_chunks = await self._recursive_token_split(text)
 
-            for i, chunk_text in enumerate(text_chunks):
-                if len(chunk_text.strip()) < self.min_chunk_size:
-                    continue
-
-                # Calculate token count for this chunk
-                token_count = self.token_service.count_tokens(chunk_text)
+            # Strip each chunk once; the stripped text is both filtered and stored
+            stripped_chunks = (chunk_text.strip() for chunk_text in text_chunks)
+            kept_chunks = [
+                (i, chunk_text) for i, chunk_text in enumerate(stripped_chunks)
+                if len(chunk_text) >= self.min_chunk_size
+            ]
+            # Count every kept chunk in one batched tokenizer call
+            token_counts = self.token_service.count_tokens_batch(
+                [chunk_text for _, chunk_text in kept_chunks]
+            )
 
-                # Create chunk with basic metadata
-                chunk = DocumentChunk.create(
-                    document_id=document.id,
-                    content=chunk_text.strip(),
-                    chunk_index=i,
-                    metadata={
-                        "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
+            for (i, chunk_text), token_count in zip(kept_chunks, token_counts):
+                # Collect chunk spec with basic metadata
+                chunk_specs.append({
+                    "content": chunk_text,
+                    "chunk_index": i,
+                    "metadata": {
+                        **base_metadata,
                         "chunk_token_count": token_count,
-                        "chunk_char_count": len(chunk_text),
-                        "processing_method": "simple_token_chunking"
+                        "chunk_char_count": len(chunk_text)
                     }
-                )
-
-                chunks.append(chunk)
+                })
 
-            return chunks
+            return DocumentChunk.create_many(document.id, chunk_specs)
 
         except Exception as e:
             self.logger.error(f"Failed to create chunks: {str(e)}")
@@ -0,0 +1,425 @@
+import re
+import os
+import sys
+import logging
+import numpy as np
+import spacy
+from typing import List, Tuple, Optional
+from ...core.ports.token_service import TokenService
+
+
+class TokenTextSplitter:
+    """
+    Recursive token-based text splitter shared by the spaCy-based processors.
+
+    Text is split by paragraphs, then sentences, then words until every piece
+    fits in chunk_size tokens, and consecutive chunks are overlapped by
+    chunk_overlap tokens. Holds only the tokenizer and an optional sentencizer,
+    so it is cheap to rebuild inside worker processes.
+    """
+
+    # Sentence boundary: terminal punctuation, whitespace, then an uppercase letter or quote
+    _SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z"\'])')
+    # Paragraph break plus the whitespace around it, so split pieces come out already stripped
+    _PARAGRAPH_SPLIT_RE = re.compile(r'\s*\n\n\s*')
+    # Whitespace following a paragraph break, consumed along with it
+    _TRAILING_WHITESPACE_RE = re.compile(r'\s*')
+    # Positions just after sentence punctuation or a newline, used by the character fallback
+    _FALLBACK_BOUNDARY_RE = re.compile(r'[.!?\n]\s')
+    # First non-whitespace character of a span, used when trimming offsets
+    _NON_WHITESPACE_RE = re.compile(r'\S')
+    # Texts longer than this many characters per chunk token are split without a fit check
+    _SPLIT_WITHOUT_COUNT_CHARS_PER_TOKEN = 6
+    # Overlap donors are encoded from a tail of this many characters per overlap token
+    _OVERLAP_TAIL_CHARS_PER_TOKEN = 8
+    # Extra tokens a tail must yield before its cut edge, so the kept suffix tokenizes as in the full chunk
+    _OVERLAP_TAIL_SLACK_TOKENS = 8
+    # Minimum paragraphs before sentence splitting is worth spreading over processes
+    _PARALLEL_SENTENCIZE_MIN_PARAGRAPHS = 32
+
+    def __init__(
+            self,
+            token_service: TokenService,
+            chunk_size: int,
+            chunk_overlap: int,
+            min_chunk_size: int,
+            use_spacy_sentences: bool = False,
+            spacy_lang: str = "en",
+            sentence_batch_size: int = 64,
+            parallel_sentencize: bool = sys.platform != "win32",
+    ):
+        """
+        Args:
+            token_service: Service for token counting, encoding and decoding
+            chunk_size: Maximum tokens per chunk
+            chunk_overlap: Tokens of the previous chunk prepended to each chunk
+            min_chunk_size: Chunks with fewer characters are dropped from records
+            use_spacy_sentences: Fall back to spaCy's sentencizer for paragraphs the regex cannot split
+            spacy_lang: Language of the sentencizer pipeline
+            sentence_batch_size: Paragraphs per nlp.pipe batch when use_spacy_sentences is set
+            parallel_sentencize: Spread large nlp.pipe batches over worker processes
+        """
+        self.logger = logging.getLogger(__name__)
+        self.token_service = token_service
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.min_chunk_size = min_chunk_size
+        self.sentence_batch_size = sentence_batch_size
+        self.parallel_sentencize = parallel_sentencize
+        self.sent_nlp = self._build_sentence_pipeline(spacy_lang) if use_spacy_sentences else None
+
+    @staticmethod
+    def _build_sentence_pipeline(lang: str) -> spacy.Language:
+        """
+        Build a sentence-only pipeline for chunking.
+
+        Only sentence boundaries are needed, so a blank pipeline with the
+        rule-based sentencizer replaces running the tagger, parser and NER
+        of the full model.
+        """
+        sent_nlp = spacy.blank(lang)
+        sent_nlp.add_pipe("sentencizer")
+        return sent_nlp
+
+    def split_into_records(
+            self,
+            text: str,
+            paragraphs: Optional[List[str]] = None,
+            paragraph_tokens: Optional[List[int]] = None
+    ) -> List[Tuple[int, str, int]]:
+        """Split text into (chunk_index, content, token_count) records, dropping undersized chunks"""
+        text_chunks = self.split(text, paragraphs, paragraph_tokens)
+
+        # Split chunks come out stripped, so no further strip passes here
+        kept_chunks = [
+            (i, chunk_text) for i, chunk_text in enumerate(text_chunks)
+            if len(chunk_text) >= self.min_chunk_size
+        ]
+        # Count every kept chunk in one batched tokenizer call
+        token_counts = self.token_service.count_tokens_batch(
+            [chunk_text for _, chunk_text in kept_chunks]
+        )
+
+        return [
+            (i, chunk_text, token_count)
+            for (i, chunk_text), token_count in zip(kept_chunks, token_counts)
+        ]
+
+    def split(
+            self,
+            text: str,
+            paragraphs: Optional[List[str]] = None,
+            paragraph_tokens: Optional[List[int]] = None
+    ) -> List[str]:
+        """
+        Recursively split text based on token count.
+
+        paragraphs, when given, are the stripped, non-empty paragraphs of text
+        (e.g. layout blocks) and are used instead of re-splitting the text;
+        paragraph_tokens, when also given, are their precomputed token counts.
+        """
+        # Strip once up front; every piece split from here on is emitted stripped
+        text = text.strip()
+        try:
+            if paragraph_tokens is None:
+                # Check if text fits in one chunk
+                if self.fits_in_one_chunk(text):
+                    return [text]
+
+                # Try splitting by paragraphs first
+                if paragraphs is None:
+                    paragraphs = self.split_paragraphs(text)
+                if len(paragraphs) > 1:
+                    # Count all paragraphs in one batched tokenizer call
+                    paragraph_tokens = self.token_service.count_tokens_batch(paragraphs)
+            elif sum(paragraph_tokens) <= self.chunk_size:
+                return [text]
+
+            # Text is too large, need to split
+            chunks = []
+
+            if len(paragraphs) > 1:
+                # Sentence-split every oversized paragraph in one batched pipe call
+                oversized = [
+                    paragraph for paragraph, para_tokens in zip(paragraphs, paragraph_tokens)
+                    if para_tokens > self.chunk_size
+                ]
+                oversized_sentences = iter(self._split_into_sentences(oversized))
+
+                for start, end in self.pack_token_counts(paragraph_tokens, self.chunk_size):
+                    # If single paragraph is too large, recursively split it further
+                    if paragraph_tokens[start] > self.chunk_size:
+                        para_chunks = self._split_large_paragraph(
+                            paragraphs[start], next(oversized_sentences)
+                        )
+                        chunks.extend(para_chunks)
+                    else:
+                        chunks.append("\n\n".join(paragraphs[start:end]))
+
+            else:
+                # Single paragraph, split by sentences
+                chunks = self._split_large_paragraph(text)
+
+            # Apply overlap if we have multiple chunks
+            if len(chunks) > 1 and self.chunk_overlap > 0:
+                chunks = self._apply_overlap(chunks)
+
+            return chunks
+
+        except Exception as e:
+            self.logger.error("Failed in recursive token split: %s", e)
+            # Fallback to simple character-based splitting
+            return self._fallback_character_split(text)
+
+    def split_paragraphs(self, text: str) -> List[str]:
+        """Split already-stripped text into stripped, non-empty paragraphs"""
+        if not text.isascii():
+            return [p for p in self._PARAGRAPH_SPLIT_RE.split(text) if p]
+
+        # Same result as the regex split: each whitespace run containing a break
+        # is cut out whole. Break positions come from one vectorized scan, so
+        # only the whitespace around actual breaks is examined in Python.
+        paragraphs = []
+        start = 0
+        for brk in self._find_paragraph_breaks(text).tolist():
+            if brk < start:
+                # Already consumed with the previous break's whitespace run
+                continue
+            end = brk
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            if end > start:
+                paragraphs.append(text[start:end])
+            start = self._TRAILING_WHITESPACE_RE.match(text, brk).end()
+
+        if start < len(text):
+            paragraphs.append(text[start:])
+        return paragraphs
+
+    @staticmethod
+    def _find_paragraph_breaks(text: str) -> np.ndarray:
+        """Offsets of every "\\n\\n" in ASCII text (character and byte offsets coincide)"""
+        newlines = np.frombuffer(text.encode("ascii"), dtype=np.uint8) == 10
+        return np.flatnonzero(newlines[:-1] & newlines[1:])
+
+    def fits_in_one_chunk(self, text: str) -> bool:
+        """
+        Check whether text fits in one chunk, skipping the tokenizer when length decides it.
+
+        Every token spans at least one byte and a character at most four UTF-8
+        bytes, so text of at most chunk_size / 4 characters always fits, as does
+        ASCII text of at most chunk_size characters. Text far longer than
+        chunk_size tokens' worth of characters goes straight to splitting, which
+        re-packs it anyway.
+        """
+        text_length = len(text)
+        if text_length * 4 <= self.chunk_size:
+            return True
+        if text_length <= self.chunk_size and text.isascii():
+            return True
+        if text_length > self.chunk_size * self._SPLIT_WITHOUT_COUNT_CHARS_PER_TOKEN:
+            return False
+        return self.token_service.count_tokens(text) <= self.chunk_size
+
+    @staticmethod
+    def pack_token_counts(counts: List[int], limit: int) -> List[Tuple[int, int]]:
+        """
+        Greedily pack consecutive items into [start, end) runs of at most limit tokens.
+
+        Works on precomputed counts only: the furthest run end reachable from
+        every possible start is found in one vectorized binary search over the
+        prefix sums, leaving a plain integer walk from run to run. Callers join
+        the item slices once per run. An item larger than limit always forms a
+        run of its own.
+        """
+        # prefix[i] is the token total of counts[:i]
+        prefix = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=prefix[1:])
+
+        # furthest_end[i] is the largest end with sum(counts[i:end]) <= limit
+        furthest_end = (np.searchsorted(prefix, prefix[:-1] + limit, side='right') - 1).tolist()
+
+        runs = []
+        start = 0
+        total = len(counts)
+
+        while start < total:
+            end = max(furthest_end[start], start + 1)
+            runs.append((start, end))
+            start = end
+
+        return runs
+
+    def _split_into_sentences(self, paragraphs: List[str]) -> List[List[str]]:
+        """
+        Split paragraphs into sentences.
+
+        Always tries the precompiled regex first. When use_spacy_sentences is
+        set, paragraphs the regex could not split at all are passed to spaCy's
+        sentencizer in one batched pipe call.
+        """
+        # Paragraphs arrive stripped and the split consumes the whitespace between
+        # sentences, so the pieces are already stripped; only empties are dropped
+        split = self._SENTENCE_SPLIT_RE.split
+        sentences = [[s for s in split(paragraph) if s] for paragraph in paragraphs]
+        if self.sent_nlp is None:
+            return sentences
+
+        unsplit = [i for i, paragraph_sentences in enumerate(sentences) if len(paragraph_sentences) <= 1]
+        if not unsplit:
+            return sentences
+
+        # Small inputs stay in-process; worker start-up and Doc serialization
+        # would outweigh the parallel speedup
+        n_process = 1
+        if self.parallel_sentencize and len(unsplit) > self._PARALLEL_SENTENCIZE_MIN_PARAGRAPHS:
+            n_process = max(1, min((os.cpu_count() or 1) - 1, 4))
+
+        docs = self.sent_nlp.pipe(
+            (paragraphs[i] for i in unsplit), batch_size=self.sentence_batch_size, n_process=n_process
+        )
+        for i, doc in zip(unsplit, docs):
+            sentences[i] = [s for s in (sent.text.strip() for sent in doc.sents) if s]
+
+        return sentences
+
+    def _split_large_paragraph(
+            self,
+            paragraph: str,
+            sentences: Optional[List[str]] = None
+    ) -> List[str]:
+        """Split a large paragraph by sentences, optionally pre-split by the caller"""
+        try:
+            if sentences is None:
+                sentences = self._split_into_sentences([paragraph])[0]
+
+            if not sentences:
+                return [paragraph]
+
+            chunks = []
+            sentence_tokens = self.token_service.count_tokens_batch(sentences)
+
+            for start, end in self.pack_token_counts(sentence_tokens, self.chunk_size):
+                # If single sentence is too large, split by words
+                if sentence_tokens[start] > self.chunk_size:
+                    word_chunks = self._split_by_words(sentences[start])
+                    chunks.extend(word_chunks)
+                else:
+                    chunks.append(" ".join(sentences[start:end]))
+
+            return chunks
+
+        except Exception as e:
+            self.logger.error("Failed to split paragraph: %s", e)
+            return [paragraph]
+
+    def _split_by_words(self, text: str) -> List[str]:
+        """Split text by words when sentences are too large"""
+        words = text.split()
+        # Count every word in one batched call and pack on the counts, so each
+        # chunk string is only built once from its slice of words. Words are
+        # counted with the leading space they carry inside a joined chunk, which
+        # is how BPE tokenizers see them, so the sums track the joined count.
+        word_tokens = self.token_service.count_tokens_batch([f" {word}" for word in words])
+
+        return [
+            " ".join(words[start:end])
+            for start, end in self.pack_token_counts(word_tokens, self.chunk_size)
+        ]
+
+    def _apply_overlap(self, chunks: List[str]) -> List[str]:
+        """Apply overlap between chunks"""
+        if len(chunks) <= 1:
+            return chunks
+
+        overlapped_chunks = [chunks[0]]
+        prev_token_ids = self._encode_overlap_tails(chunks[:-1])
+
+        for chunk, prev_ids in zip(chunks[1:], prev_token_ids):
+            # Overlap is exactly the last chunk_overlap tokens of the previous chunk
+            overlap_text = self._get_overlap_text(prev_ids, self.chunk_overlap)
+
+            # Combine overlap with current chunk
+            if overlap_text:
+                overlapped_chunk = f"{overlap_text} {chunk}"
+                overlapped_chunks.append(overlapped_chunk)
+            else:
+                overlapped_chunks.append(chunk)
+
+        return overlapped_chunks
+
+    def _encode_overlap_tails(self, chunks: List[str]) -> List[List[int]]:
+        """
+        Encode just enough of each chunk's end to take its last chunk_overlap tokens.
+
+        Tokenization only differs from the full chunk near the cut, so a tail
+        that still yields slack tokens before the overlap is encoded from its
+        tail alone; chunks whose tail comes up short are re-encoded whole.
+        Both passes are single batched calls.
+        """
+        tail_chars = self.chunk_overlap * self._OVERLAP_TAIL_CHARS_PER_TOKEN
+        min_tail_tokens = self.chunk_overlap + self._OVERLAP_TAIL_SLACK_TOKENS
+        token_ids = self.token_service.encode_batch([chunk[-tail_chars:] for chunk in chunks])
+
+        short_tails = [
+            i for i, (chunk, ids) in enumerate(zip(chunks, token_ids))
+            if len(chunk) > tail_chars and len(ids) < min_tail_tokens
+        ]
+        if short_tails:
+            full_ids = self.token_service.encode_batch([chunks[i] for i in short_tails])
+            for i, ids in zip(short_tails, full_ids):
+                token_ids[i] = ids
+
+        return token_ids
+
+    def _get_overlap_text(self, token_ids: List[int], target_tokens: int) -> str:
+        """Decode the last N token IDs of a chunk for overlap"""
+        try:
+            # The cut may land inside a multi-byte character; drop its replacement char
+            overlap_text = self.token_service.decode_tokens(token_ids[-target_tokens:])
+            return overlap_text.lstrip("\ufffd").strip()
+
+        except Exception as e:
+            self.logger.error("Failed to get overlap text: %s", e)
+            return ""
+
+    def _fallback_character_split(self, text: str) -> List[str]:
+        """Fallback method for splitting text by characters"""
+        chunk_size_chars = self.chunk_size * 4  # Rough estimate: 1 token ≈ 4 chars
+        chunks = []
+
+        # Find all candidate boundaries in one scan, then cut each window at the
+        # last boundary inside it (or at the window end when there is none).
+        # Boundaries live in a packed int64 array rather than a list of Python ints.
+        boundaries = np.fromiter(
+            (m.end() for m in self._FALLBACK_BOUNDARY_RE.finditer(text)), dtype=np.int64
+        )
+        text_length = len(text)
+        start = 0
+
+        while start < text_length:
+            end = min(start + chunk_size_chars, text_length)
+            if end < text_length:
+                i = int(np.searchsorted(boundaries, end, side='right')) - 1
+                if i >= 0 and boundaries[i] > start:
+                    end = int(boundaries[i])
+
+            # Trim on offsets so only the kept text is copied, and
+            # whitespace-only windows are never materialized
+            chunk_start, chunk_end = self._trim_offsets(text, start, end)
+            if chunk_start < chunk_end:
+                chunks.append(text[chunk_start:chunk_end])
+            start = end
+
+        return chunks
+
+    def _trim_offsets(self, text: str, start: int, end: int) -> Tuple[int, int]:
+        """Narrow text[start:end] to exclude surrounding whitespace without slicing"""
+        first = self._NON_WHITESPACE_RE.search(text, start, end)
+        if first is None:
+            return end, end
+
+        start = first.start()
+        while text[end - 1].isspace():
+            end -= 1
+        return start, end
@@ -1,27 +1,76 @@
 import re
+import os
+import bisect
 import logging
-from typing import List, Dict, Any
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
 from ...core.ports.token_service import TokenService, TokenInfo
 from ...core.domain.exceptions import TokenizationError
 
 logger = logging.getLogger(__name__)
 
+# Token counts are a pure function of the text, so recurring strings (headings,
+# headers/footers, table captions) are memoized. Long texts are rarely repeated
+# and would pin memory, so only texts up to the length limit are cached.
+TOKEN_COUNT_CACHE_SIZE = 65_536
+TOKEN_COUNT_CACHE_MAX_CHARS = 2_048
+
+# Batches with fewer texts are encoded inline; handing them to threads costs more than it saves
+BATCH_THREADING_MIN_TEXTS = 32
+
+# How far (in characters) the character fallback looks for a space to cut at
+FALLBACK_BOUNDARY_WINDOW = 64
+
+# Sentence boundary: a whitespace run (line breaks included) after terminal punctuation,
+# before a capital. A single \s+ alternative matches in linear time; a separate
+# \s*\n+\s* alternative matched nothing extra and backtracked quadratically on
+# long whitespace runs that weren't followed by a capital.
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# Sentences this short or shorter are dropped as fragments
+_MIN_SENTENCE_CHARS = 10
+
 
 class TikTokenService(TokenService):
     """TikToken-based tokenization service for accurate token counting"""
 
-    def __init__(self, model_name: str = "cl100k_base"):
+    def __init__(
+            self,
+            model_name: str = "cl100k_base",
+            num_threads: Optional[int] = None,
+            enable_cache: bool = True
+    ):
         """
         Initialize with tiktoken encoding
 
         Args:
             model_name: Encoding name (cl100k_base for GPT-4, p50k_base for older models)
+            num_threads: Threads for batched encoding (defaults to the CPU count)
+            enable_cache: Memoize token counts of short texts
         """
         try:
             import tiktoken
             self.encoding = tiktoken.get_encoding(model_name)
             self.model_name = model_name
+            # Batched encodes run in tiktoken's Rust core with the GIL released
+            self.num_threads = num_threads or os.cpu_count() or 1
+            # tiktoken's *_batch helpers start a thread pool per call; this one is started
+            # on the first batch large enough to need it, then reused until close()
+            self._batch_executor: Optional[ThreadPoolExecutor] = None
+            self._batch_executor_lock = threading.Lock()
             self._char_to_token_ratio = 4.0  # Rough estimate: 1 token ≈ 4 characters
+            # Short text -> token count, least recently used first. Kept as an explicit
+            # LRU rather than functools.lru_cache so batched counts can look up and
+            # fill it too; the lock covers the split worker threads sharing it.
+            self._token_count_cache: "OrderedDict[str, int]" = OrderedDict()
+            self._token_count_lock = threading.Lock()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            # With caching disabled no text is short enough to be cached
+            self._cache_max_chars = TOKEN_COUNT_CACHE_MAX_CHARS if enable_cache else -1
         except ImportError:
             raise TokenizationError(
                 "tiktoken not installed. Install with: pip install tiktoken"
@@ -34,42 +83,161 @@ class TikTokenService(TokenService):
         if not text or not text.strip():
             return 0
 
+        if len(text) > self._cache_max_chars:
+            return self._count_tokens_uncached(text)
+
+        with self._token_count_lock:
+            count = self._token_count_cache.get(text)
+            if count is not None:
+                self._token_count_cache.move_to_end(text)
+                self._cache_hits += 1
+                return count
+            self._cache_misses += 1
+
+        count = self._count_tokens_uncached(text)
+        self._store_counts([(text, count)])
+        return count
+
+    def _count_tokens_uncached(self, text: str) -> int:
+        """Count tokens in text with the tokenizer"""
         try:
-            return len(self.encoding.encode(text))
+            return len(self.encoding.encode_ordinary(text))
         except Exception as e:
             logger.error(f"Error counting tokens: {str(e)}")
             # Fallback to character-based estimation
             return self.estimate_tokens_from_chars(len(text))
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts.
+
+        Short texts are served from the token-count cache; only distinct misses
+        are encoded, in one batch that runs on the shared thread pool when large.
+        """
+        if not texts:
+            return []
+
+        counts = [0] * len(texts)
+        # Distinct texts still to be encoded -> their positions in the batch
+        misses: Dict[str, List[int]] = {}
+
+        with self._token_count_lock:
+            cache = self._token_count_cache
+            for i, text in enumerate(texts):
+                if not text or not text.strip():
+                    continue
+                if len(text) <= self._cache_max_chars:
+                    count = cache.get(text)
+                    if count is not None:
+                        cache.move_to_end(text)
+                        self._cache_hits += 1
+                        counts[i] = count
+                        continue
+                    self._cache_misses += 1
+                misses.setdefault(text, []).append(i)
+
+        if not misses:
+            return counts
+
+        miss_texts = list(misses)
+        try:
+            miss_counts = [
+                len(token_ids)
+                for token_ids in self._map_batch(self.encoding.encode_ordinary, miss_texts)
+            ]
+        except Exception as e:
+            logger.error(f"Error batch counting tokens: {str(e)}")
+            # Fall back to per-text counting so one bad input doesn't fail the batch
+            miss_counts = [self._count_tokens_uncached(text) for text in miss_texts]
+
+        for text, count in zip(miss_texts, miss_counts):
+            for i in misses[text]:
+                counts[i] = count
+        self._store_counts(zip(miss_texts, miss_counts))
+
+        return counts
+
+    def _store_counts(self, text_counts: Iterable[Tuple[str, int]]) -> None:
+        """Cache token counts of short texts, evicting the least recently used beyond the bound"""
+        with self._token_count_lock:
+            cache = self._token_count_cache
+            for text, count in text_counts:
+                if len(text) <= self._cache_max_chars:
+                    cache[text] = count
+            while len(cache) > TOKEN_COUNT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _map_batch(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """Apply a tokenizer call to every item, on the shared pool only for large batches"""
+        if len(items) < BATCH_THREADING_MIN_TEXTS or self.num_threads == 1:
+            return [func(item) for item in items]
+        return list(self._get_batch_executor().map(func, items))
+
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """The shared batch thread pool, started on first use"""
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.num_threads, thread_name_prefix="tiktoken-batch"
+                )
+            return self._batch_executor
+
+    def close(self) -> None:
+        """Shut down the batch thread pool, if it was started"""
+        with self._batch_executor_lock:
+            if self._batch_executor is not None:
+                self._batch_executor.shutdown()
+                self._batch_executor = None
+
     def tokenize(self, text: str) -> TokenInfo:
         """Tokenize text and return detailed information"""
         if not text or not text.strip():
-            return TokenInfo(token_count=0, tokens=[], token_ids=[])
+            return TokenInfo(token_ids=[])
 
         try:
-            token_ids = self.encoding.encode(text)
-            tokens = [self.encoding.decode([token_id]) for token_id in token_ids]
+            token_ids = self.encoding.encode_ordinary(text)
 
+            # Token strings are only decoded if the caller reads them
             return TokenInfo(
-                token_count=len(token_ids),
-                tokens=tokens,
-                token_ids=token_ids
+                token_ids=token_ids,
+                token_decoder=self._decode_token_strings
             )
         except Exception as e:
             logger.error(f"Error tokenizing text: {str(e)}")
             raise TokenizationError(f"Failed to tokenize text: {str(e)}")
 
+    def _decode_token_strings(self, token_ids: List[int]) -> List[str]:
+        """Decode each token ID to its own string"""
+        # One call for every token's bytes instead of a decode per token;
+        # errors="replace" matches what decode() does for partial characters
+        return [
+            token_bytes.decode("utf-8", errors="replace")
+            for token_bytes in self.encoding.decode_tokens_bytes(token_ids)
+        ]
+
     def encode_text(self, text: str) -> List[int]:
         """Encode text to token IDs"""
         if not text or not text.strip():
             return []
 
         try:
-            return self.encoding.encode(text)
+            # Document text is untrusted; special-token strings like <|endoftext|> are plain text
+            return self.encoding.encode_ordinary(text)
         except Exception as e:
             logger.error(f"Error encoding text: {str(e)}")
             raise TokenizationError(f"Failed to encode text: {str(e)}")
 
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Encode many texts to token IDs; large batches are encoded on the shared thread pool"""
+        if not texts:
+            return []
+
+        try:
+            return self._map_batch(self.encoding.encode_ordinary, texts)
+        except Exception as e:
+            logger.error(f"Error batch encoding texts: {str(e)}")
+            raise TokenizationError(f"Failed to encode texts: {str(e)}")
+
     def decode_tokens(self, token_ids: List[int]) -> str:
         """Decode token IDs back to text"""
         if not token_ids:
@@ -101,50 +269,38 @@ class TikTokenService(TokenService):
             # First, try to split by sentences for better semantic boundaries
             sentences = self._split_into_sentences(text)
             chunks = []
-            current_chunk_sentences = []
-            current_token_count = 0
-
-            for sentence in sentences:
-                sentence_tokens = self.count_tokens(sentence)
+            # Each sentence is counted exactly once; the current chunk is the sentence
+            # range [chunk_start, i), so its token total is a prefix-sum difference
+            sentence_counts = self.count_tokens_batch(sentences)
+            prefix_sums = [0, *itertools.accumulate(sentence_counts)]
+            chunk_start = 0
 
+            for i, sentence_tokens in enumerate(sentence_counts):
                 # If single sentence exceeds max_tokens, split it further
                 if sentence_tokens > max_tokens:
                     # Save current chunk if exists
-                    if current_chunk_sentences:
-                        chunks.append(" ".join(current_chunk_sentences))
-                        current_chunk_sentences = []
-                        current_token_count = 0
+                    if chunk_start < i:
+                        chunks.append(" ".join(sentences[chunk_start:i]))
 
                     # Split long sentence by tokens
                     long_sentence_chunks = self._split_long_text_by_tokens(
-                        sentence, max_tokens, overlap_tokens
+                        sentences[i], max_tokens, overlap_tokens
                     )
                     chunks.extend(long_sentence_chunks)
+                    chunk_start = i + 1
                     continue
 
                 # Check if adding this sentence would exceed max_tokens
-                if current_token_count + sentence_tokens > max_tokens and current_chunk_sentences:
+                if prefix_sums[i + 1] - prefix_sums[chunk_start] > max_tokens and chunk_start < i:
                     # Save current chunk
-                    chunks.append(" ".join(current_chunk_sentences))
+                    chunks.append(" ".join(sentences[chunk_start:i]))
 
                     # Start new chunk with overlap
-                    if overlap_tokens > 0:
-                        overlap_sentences = self._get_overlap_sentences(
-                            current_chunk_sentences, overlap_tokens
-                        )
-                        current_chunk_sentences = overlap_sentences
-                        current_token_count = self.count_tokens(" ".join(overlap_sentences))
-                    else:
-                        current_chunk_sentences = []
-                        current_token_count = 0
-
-                # Add sentence to current chunk
-                current_chunk_sentences.append(sentence)
-                current_token_count += sentence_tokens
+                    chunk_start = self._get_overlap_start(prefix_sums, chunk_start, i, overlap_tokens)
 
             # Add final chunk
-            if current_chunk_sentences:
-                chunks.append(" ".join(current_chunk_sentences))
+            if chunk_start < len(sentences):
+                chunks.append(" ".join(sentences[chunk_start:]))
 
             return [chunk.strip() for chunk in chunks if chunk.strip()]
 
@@ -155,16 +311,12 @@ class TikTokenService(TokenService):
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences using regex"""
-        # Enhanced sentence splitting pattern
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])|(?<=[.!?])\s*\n+\s*(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
-
-        # Clean and filter sentences
-        cleaned_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(sentence) > 10:  # Filter very short sentences
-                cleaned_sentences.append(sentence)
+        # Clean and filter very short sentences
+        cleaned_sentences = [
+            sentence
+            for sentence in map(str.strip, _SENTENCE_SPLIT_RE.split(text))
+            if len(sentence) > _MIN_SENTENCE_CHARS
+        ]
 
         return cleaned_sentences if cleaned_sentences else [text]
 
@@ -180,51 +332,40 @@ class TikTokenService(TokenService):
             if len(token_ids) <= max_tokens:
                 return [text]
 
-            chunks = []
-            start = 0
-
-            while start < len(token_ids):
+            # Windows start every max_tokens - overlap_tokens tokens; the last one
+            # is the first that reaches the end of the text
+            windows = []
+            for start in range(0, len(token_ids), max_tokens - overlap_tokens):
                 end = min(start + max_tokens, len(token_ids))
-                chunk_token_ids = token_ids[start:end]
-                chunk_text = self.decode_tokens(chunk_token_ids)
-
-                if chunk_text.strip():
-                    chunks.append(chunk_text)
-
-                # Move start position considering overlap
-                start = end - overlap_tokens
-                if start >= len(token_ids):
+                windows.append(token_ids[start:end])
+                if end == len(token_ids):
                     break
 
-            return chunks
+            chunk_texts = self._map_batch(self.encoding.decode, windows)
+            return [chunk_text for chunk_text in chunk_texts if chunk_text and not chunk_text.isspace()]
 
         except Exception as e:
             logger.error(f"Error in token-based splitting: {str(e)}")
             # Last resort: character-based splitting with token estimation
             return self._fallback_char_split(text, max_tokens, overlap_tokens)
 
-    def _get_overlap_sentences(
+    def _get_overlap_start(
             self,
-            sentences: List[str],
+            prefix_sums: List[int],
+            start: int,
+            end: int,
             max_overlap_tokens: int
-    ) -> List[str]:
-        """Get sentences from the end for overlap"""
-        if not sentences or max_overlap_tokens <= 0:
-            return []
-
-        overlap_sentences = []
-        current_tokens = 0
+    ) -> int:
+        """
+        Index of the first sentence of [start, end) kept for overlap.
 
-        # Start from the end and work backwards
-        for sentence in reversed(sentences):
-            sentence_tokens = self.count_tokens(sentence)
-            if current_tokens + sentence_tokens <= max_overlap_tokens:
-                overlap_sentences.insert(0, sentence)
-                current_tokens += sentence_tokens
-            else:
-                break
+        The kept sentences are the longest tail whose tokens fit in
+        max_overlap_tokens; with prefix sums that is a binary search.
+        """
+        if max_overlap_tokens <= 0:
+            return end
 
-        return overlap_sentences
+        return bisect.bisect_left(prefix_sums, prefix_sums[end] - max_overlap_tokens, start, end)
 
     def _fallback_char_split(
             self,
@@ -244,15 +385,29 @@ class TikTokenService(TokenService):
 
         while start < len(text):
             end = min(start + max_chars, len(text))
+            if end < len(text):
+                # Pull the cut back to a nearby space so words aren't split
+                boundary = text.rfind(' ', max(start + 1, end - FALLBACK_BOUNDARY_WINDOW), end)
+                if boundary != -1:
+                    end = boundary
+
             chunk = text[start:end]
 
-            if chunk.strip():
+            if not chunk.isspace():
                 chunks.append(chunk)
 
-            start = end - overlap_chars
-            if start >= len(text):
+            if end >= len(text):
                 break
 
+            next_start = end - overlap_chars
+            if overlap_chars > 0:
+                # Start the overlap on a word boundary too
+                boundary = text.find(' ', next_start, min(end, next_start + FALLBACK_BOUNDARY_WINDOW))
+                if boundary != -1:
+                    next_start = boundary + 1
+            # Always make progress, even if the boundary search moved the cut back
+            start = next_start if next_start > start else end
+
         return chunks
 
     def get_model_info(self) -> Dict[str, Any]:
@@ -261,9 +416,21 @@ class TikTokenService(TokenService):
             "model_name": self.model_name,
             "encoding_name": self.encoding.name,
             "char_to_token_ratio": self._char_to_token_ratio,
-            "max_token_value": self.encoding.max_token_value if hasattr(self.encoding, 'max_token_value') else None
+            "max_token_value": self.encoding.max_token_value if hasattr(self.encoding, 'max_token_value') else None,
+            "token_count_cache": {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "maxsize": TOKEN_COUNT_CACHE_SIZE,
+                "currsize": len(self._token_count_cache)
+            }
         }
 
     def estimate_tokens_from_chars(self, char_count: int) -> int:
         """Rough estimation of tokens from character count"""
         return max(1, int(char_count / self._char_to_token_ratio))
+
+
+@functools.lru_cache(maxsize=4)
+def get_tiktoken_service(model_name: str = "cl100k_base") -> TikTokenService:
+    """Shared TikTokenService per encoding, so the BPE table and count cache exist once per process"""
+    return TikTokenService(model_name)
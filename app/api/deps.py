@@ -8,6 +8,7 @@ from ..core.domain.entities.user import AuthenticatedUser
 
 # Use Cases
 from ..core.use_cases.process_document import ProcessDocumentUseCase
+from ..core.use_cases.validate_document import ValidateDocumentUseCase
 from ..core.use_cases.authenticate_user import AuthenticateUserUseCase
 
 # Errors
@@ -31,9 +32,14 @@ def get_document_processing_use_case(
 ) -> ProcessDocumentUseCase:
     return ProcessDocumentUseCase(
         document_processor=document_processor,
+        max_concurrency=settings.max_concurrent_processes,
     )
 
 
+def get_document_validation_use_case() -> ValidateDocumentUseCase:
+    return ValidateDocumentUseCase(max_file_size=settings.max_file_size)
+
+
 def get_auth_service(request: Request) -> AuthService:
     auth_service = getattr(request.app.state, "auth_service", None)
     if auth_service is None:
@@ -1,4 +1,5 @@
 import shutil
+import asyncio
 import logging
 import traceback
 from pathlib import Path
@@ -6,12 +7,14 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from ...config import settings
 from ...core.use_cases.process_document import ProcessDocumentUseCase
+from ...core.use_cases.validate_document import ValidateDocumentUseCase
 from ...core.domain.entities.document import Document as DomainDocument
 from ...core.domain.entities.user import AuthenticatedUser
 from ...core.domain.value_objects.document_type import DocumentType
-from ...core.domain.exceptions import InvalidDocumentTypeError
+from ...core.domain.exceptions import InvalidDocumentTypeError, DocumentValidationError
 from ...api.deps import (
     get_document_processing_use_case,
+    get_document_validation_use_case,
     authenticate_user
 )
 
@@ -31,6 +34,59 @@ def determine_document_type(filename: str) -> DocumentType:
     else:
         raise InvalidDocumentTypeError(f"Unsupported file extension: {ext}")
 
+async def save_upload(file: UploadFile) -> DomainDocument:
+    """Stream an upload to the uploads directory and wrap it in a domain document"""
+    # Determine type
+    try:
+        doc_type = determine_document_type(file.filename)
+    except InvalidDocumentTypeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    uploads_base = Path(settings.UPLOADS_DIR)
+    collection_dir = uploads_base
+    collection_dir.mkdir(parents=True, exist_ok=True)
+    
+    import uuid
+    new_id = str(uuid.uuid4())
+    ext = Path(file.filename).suffix.lower()
+    saved_filename = f"{new_id}{ext}"
+    saved_path = collection_dir / saved_filename
+    
+    try:
+        # Stream the spooled upload to disk in 1 MiB pieces on a worker thread, so
+        # neither a full in-memory copy nor the disk write blocks the event loop
+        with open(saved_path, "wb") as out_file:
+            await asyncio.to_thread(shutil.copyfileobj, file.file, out_file, 1 << 20)
+        logger.info("File saved to: %s", saved_path)
+    except Exception as e:
+        logger.error("Failed to save file: %s", e)
+        saved_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail=f"Failed to save file: {e}")
+    finally:
+        file.file.close()
+    
+    # Create DomainDocument entity
+    file_stat = saved_path.stat()
+    domain_doc = DomainDocument.create(
+        filename=saved_filename,
+        original_filename=file.filename,
+        file_path=str(saved_path),
+        file_size=file_stat.st_size,
+        document_type=doc_type,
+        metadata={}
+    )
+    logger.info("Created domain document: %s", domain_doc.id)
+    return domain_doc
+
+def remove_upload(saved_path: Path) -> None:
+    """Delete an uploaded file once it has been processed (or failed to)"""
+    if saved_path.exists():
+        try:
+            saved_path.unlink()
+            logger.info("Successfully deleted uploaded file: %s", saved_path)
+        except Exception as e:
+            logger.warning("Failed to delete uploaded file %s: %s", saved_path, e)
+
 @router.post("/upload")
 async def upload_document(
     file: UploadFile = File(...),
@@ -39,71 +95,40 @@ async def upload_document(
 ):
     # Log authenticated user (if auth is enabled)
     if current_user:
-        logger.info(f"Document upload by authenticated user: {current_user.id}")
+        logger.info("Document upload by authenticated user: %s", current_user.id)
 
-    saved_path = None
-    
+    domain_doc = await save_upload(file)
     try:
-        # 2. Determine type
-        try:
-            doc_type = determine_document_type(file.filename)
-        except InvalidDocumentTypeError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        
-        uploads_base = Path(settings.UPLOADS_DIR)
-        collection_dir = uploads_base
-        collection_dir.mkdir(parents=True, exist_ok=True)
-        
-        import uuid
-        new_id = str(uuid.uuid4())
-        ext = Path(file.filename).suffix.lower()
-        saved_filename = f"{new_id}{ext}"
-        saved_path = collection_dir / saved_filename
-        
-        try:
-            # Write file
-            with open(saved_path, "wb") as out_file:
-                shutil.copyfileobj(file.file, out_file)
-            logger.info(f"File saved to: {saved_path}")
-        except Exception as e:
-            logger.error(f"Failed to save file: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to save file: {e}")
-        finally:
-            file.file.close()
-        
-        # 4. Create DomainDocument entity
-        file_stat = saved_path.stat()
-        domain_doc = DomainDocument.create(
-            filename=saved_filename,
-            original_filename=file.filename,
-            file_path=str(saved_path),
-            file_size=file_stat.st_size,
-            document_type=doc_type,
-            metadata={}
-        )
-        logger.info(f"Created domain document: {domain_doc.id}")
-        
         # Process the document
-        result = await document_use_case.document_processor.process_document(domain_doc)
-        
-        # Clean up the uploaded file after successful processing
-        if saved_path and saved_path.exists():
-            try:
-                saved_path.unlink()
-                logger.info(f"Successfully deleted uploaded file: {saved_path}")
-            except Exception as e:
-                logger.warning(f"Failed to delete uploaded file {saved_path}: {e}")
-        
-        return result
+        return await document_use_case.document_processor.process_document(domain_doc)
+    finally:
+        # Clean up the uploaded file whether or not processing succeeded
+        remove_upload(Path(domain_doc.file_path))
+
+@router.post("/upload/batch")
+async def upload_documents(
+    files: List[UploadFile] = File(...),
+    document_use_case: ProcessDocumentUseCase = Depends(get_document_processing_use_case),
+    validation_use_case: ValidateDocumentUseCase = Depends(get_document_validation_use_case),
+    current_user: Optional[AuthenticatedUser] = Depends(authenticate_user)
+):
+    # Log authenticated user (if auth is enabled)
+    if current_user:
+        logger.info("Batch upload of %d documents by authenticated user: %s", len(files), current_user.id)
+
+    domain_docs = []
+    try:
+        for file in files:
+            domain_docs.append(await save_upload(file))
         
-    except Exception as e:
-        # If processing fails, still try to clean up the file
-        if saved_path and saved_path.exists():
-            try:
-                saved_path.unlink()
-                logger.info(f"Cleaned up uploaded file after processing error: {saved_path}")
-            except Exception as cleanup_error:
-                logger.warning(f"Failed to cleanup file {saved_path} after error: {cleanup_error}")
+        # Reject the whole batch up front rather than failing part-way through processing
+        try:
+            await validation_use_case.execute_batch(domain_docs)
+        except DocumentValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # Re-raise the original exception
-        raise
+        # Documents are processed concurrently, at most max_concurrent_processes at a time
+        return await document_use_case.execute_batch(domain_docs)
+    finally:
+        for domain_doc in domain_docs:
+            remove_upload(Path(domain_doc.file_path))
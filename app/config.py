@@ -62,8 +62,19 @@ class Settings(BaseSettings):
     # spaCy settings
     spacy_model: str = "en_core_web_sm"
     
+    # Tokenizer settings
+    tokenizer_model: str = "cl100k_base"
+    # Where tiktoken keeps downloaded BPE files; unset uses tiktoken's temp-dir default
+    tiktoken_cache_dir: Optional[str] = None
+    # Directory for extraction/chunking results keyed by file content; unset disables caching
+    processing_cache_dir: Optional[str] = None
+    # Size the processing cache is trimmed to, least recently used results first
+    processing_cache_max_bytes: int = 1 << 30
+    
     # Performance
     max_concurrent_processes: int = 4
+    # Worker processes for chunk splitting; 1 splits on the in-process thread pool
+    split_workers: int = 1
     processing_timeout: int = 300  # 5 minutes
 
     UPLOADS_DIR: Optional[str] = Field(default="data/uploads", env="UPLOADS_DIR", description="The directory to upload to.")
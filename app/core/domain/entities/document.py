@@ -6,7 +6,7 @@ from ..value_objects.document_type import DocumentType
 from ..value_objects.processing_status import ProcessingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     created_at: datetime
     id: str = field(default_factory=lambda: str(uuid4()))
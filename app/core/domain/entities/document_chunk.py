@@ -1,14 +1,45 @@
+import os
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from datetime import datetime, UTC
-from uuid import uuid4
+from uuid import UUID
 from ..value_objects.chunk_metadata import ChunkMetadata
 
+# Chunk IDs are UUID4s whose random bytes are read from the OS in blocks,
+# so creating chunks one at a time doesn't cost an os.urandom call each
+_CHUNK_ID_BATCH_SIZE = 256
+_chunk_id_lock = threading.Lock()
+_chunk_id_bytes = b""
+_chunk_id_offset = 0
 
-@dataclass
+
+def _reset_chunk_id_buffer() -> None:
+    """Drop buffered randomness so a forked child never reuses the parent's IDs"""
+    global _chunk_id_bytes, _chunk_id_offset
+    _chunk_id_bytes = b""
+    _chunk_id_offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_chunk_id_buffer)
+
+
+def _new_chunk_id() -> str:
+    """Random UUID4 string drawn from the buffered block"""
+    global _chunk_id_bytes, _chunk_id_offset
+    with _chunk_id_lock:
+        if _chunk_id_offset >= len(_chunk_id_bytes):
+            _chunk_id_bytes = os.urandom(16 * _CHUNK_ID_BATCH_SIZE)
+            _chunk_id_offset = 0
+        raw = _chunk_id_bytes[_chunk_id_offset:_chunk_id_offset + 16]
+        _chunk_id_offset += 16
+    return str(UUID(bytes=raw, version=4))
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     created_at: datetime
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_new_chunk_id)
     document_id: str = ""
     content: str = ""
     chunk_index: int = 0
@@ -26,19 +57,55 @@ class DocumentChunk:
         # start_char: int = 0,
         # end_char: int = 0,
         # token_count: int = 0,
-        metadata: Optional[ChunkMetadata] = None
+        metadata: Optional[ChunkMetadata] = None,
+        created_at: Optional[datetime] = None
     ) -> "DocumentChunk":
+        # Callers creating many chunks can read the clock once and pass it in
         return cls(
             document_id=document_id,
             content=content,
             chunk_index=chunk_index,
-            created_at=datetime.now(UTC),
+            created_at=created_at or datetime.now(UTC),
             # start_char=start_char,
             # end_char=end_char,
             # token_count=token_count,
             metadata=metadata or ChunkMetadata()
         )
     
+    @classmethod
+    def create_many(
+        cls,
+        document_id: str,
+        chunk_specs: List[Dict[str, Any]]
+    ) -> List["DocumentChunk"]:
+        """
+        Create all chunks of a document in one batch.
+        
+        Randomness for every chunk ID is drawn with a single os.urandom call
+        and all chunks share one creation timestamp.
+        
+        Args:
+            document_id: ID of the source document
+            chunk_specs: Dicts with content, chunk_index and optional metadata
+            
+        Returns:
+            List of DocumentChunk entities in spec order
+        """
+        random_bytes = os.urandom(16 * len(chunk_specs))
+        created_at = datetime.now(UTC)
+        
+        return [
+            cls(
+                id=str(UUID(bytes=random_bytes[i * 16:(i + 1) * 16], version=4)),
+                document_id=document_id,
+                content=spec["content"],
+                chunk_index=spec["chunk_index"],
+                created_at=created_at,
+                metadata=spec.get("metadata") or ChunkMetadata()
+            )
+            for i, spec in enumerate(chunk_specs)
+        ]
+    
     def update_content(self, content: str) -> None:
         """Update chunk content"""
         self.content = content
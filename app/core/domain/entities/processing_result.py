@@ -5,7 +5,7 @@ from .document_chunk import DocumentChunk
 from ..value_objects.processing_status import ProcessingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     task_id: str
     document_id: str
@@ -15,7 +15,7 @@ class ProcessingResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
     processing_time: float = 0.0
     error_message: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now(UTC))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     completed_at: Optional[datetime] = None
     
     @classmethod
@@ -2,7 +2,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuredElement:
     """Represents a structured element from document processing"""
     content: str
@@ -10,3 +10,4 @@ class StructuredElement:
     level: Optional[int] = None  # For headings
     page_number: Optional[int] = None
     bbox: Optional[List[float]] = None  # Bounding box coordinates
+    token_count: Optional[int] = None  # Cached token count of content, if computed
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetadata:
     # Content characteristics
     language: Optional[str] = None
@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 from pathlib import Path
 
@@ -10,38 +11,35 @@ class DocumentType(str, Enum):
     UNKNOWN = "unknown"
     
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def from_filename(cls, filename: str) -> "DocumentType":
         """Determine document type from filename"""
         ext = Path(filename).suffix.lower().lstrip(".")
-        
-        type_mapping = {
-            "pdf": cls.PDF,
-            "docx": cls.DOCX,
-            "doc": cls.DOC,
-            "txt": cls.TXT
-        }
-        
-        return type_mapping.get(ext, cls.UNKNOWN)
+        return _EXTENSION_TYPES.get(ext, cls.UNKNOWN)
     
     @classmethod
     def from_mime_type(cls, mime_type: str) -> "DocumentType":
         """Determine document type from MIME type"""
-        mime_mapping = {
-            "application/pdf": cls.PDF,
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": cls.DOCX,
-            "application/msword": cls.DOC,
-            "text/plain": cls.TXT
-        }
-        
-        return mime_mapping.get(mime_type, cls.UNKNOWN)
+        return _MIME_TYPES.get(mime_type, cls.UNKNOWN)
     
     def get_mime_type(self) -> str:
         """Get MIME type for document type"""
-        mime_mapping = {
-            self.PDF: "application/pdf",
-            self.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            self.DOC: "application/msword",
-            self.TXT: "text/plain"
-        }
-        return mime_mapping.get(self, "application/octet-stream")
-    
\ No newline at end of file
+        return _TYPE_MIME_TYPES.get(self, "application/octet-stream")
+
+
+# Lookup tables are built once here; members can't be referenced inside the Enum body
+_EXTENSION_TYPES = {
+    "pdf": DocumentType.PDF,
+    "docx": DocumentType.DOCX,
+    "doc": DocumentType.DOC,
+    "txt": DocumentType.TXT
+}
+
+_MIME_TYPES = {
+    "application/pdf": DocumentType.PDF,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DocumentType.DOCX,
+    "application/msword": DocumentType.DOC,
+    "text/plain": DocumentType.TXT
+}
+
+_TYPE_MIME_TYPES = {document_type: mime_type for mime_type, document_type in _MIME_TYPES.items()}
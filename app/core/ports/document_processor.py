@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import AsyncIterator, List, Tuple
 from ..domain.entities.document import Document
 from ..domain.entities.document_chunk import DocumentChunk
 
@@ -21,7 +21,28 @@ class DocumentProcessor(ABC):
         """
         pass
 
+    async def iter_chunks(self, document: Document) -> AsyncIterator[DocumentChunk]:
+        """
+        Process a document and yield its chunks as they are produced.
+
+        Processors that can emit chunks incrementally override this; the
+        default processes the whole document first.
+
+        Args:
+            document: Document entity to process
+
+        Yields:
+            Document chunks in chunk order
+        """
+        doc_chunks, _ = await self.process_document(document)
+        for chunk in doc_chunks:
+            yield chunk
+
     @abstractmethod
     def get_supported_types(self) -> List[str]:
         """Return list of supported document types"""
         pass
+
+    def close(self) -> None:
+        """Release worker pools and other resources; processors without any keep the default no-op"""
+        pass
@@ -1,18 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, List, Optional, Union
+import asyncio
 import io
 
+# Default size of the pieces open_file yields
+FILE_READ_CHUNK_SIZE = 1024 * 1024
+# Default number of get_file calls get_files_batch keeps in flight
+FILE_BATCH_MAX_CONCURRENCY = 16
+
 
 class StorageService(ABC):
     """Port for storage operations"""
     
     @abstractmethod
-    async def save_file(self, file_content: bytes, filename: str) -> str:
+    async def save_file(
+        self,
+        file_content: Union[bytes, bytearray, memoryview, BinaryIO],
+        filename: str
+    ) -> str:
         """
         Save file and return storage path.
         
+        Adapters write buffers as given and copy readable file objects in
+        pieces, so callers never need to build an intermediate bytes copy.
+        
         Args:
-            file_content: File content as bytes
+            file_content: File content as a bytes-like buffer or a binary file object
             filename: Original filename
             
         Returns:
@@ -25,6 +38,8 @@ class StorageService(ABC):
         """
         Retrieve file content.
         
+        Holds the whole file in memory; prefer open_file for large files.
+        
         Args:
             file_path: Storage path/identifier
             
@@ -33,6 +48,59 @@ class StorageService(ABC):
         """
         pass
     
+    async def open_file(
+        self,
+        file_path: str,
+        chunk_size: int = FILE_READ_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream file content in pieces.
+        
+        Adapters that can read incrementally (a thread-offloaded file handle,
+        an object-store streaming body) override this; the default loads the
+        whole file with get_file first.
+        
+        Args:
+            file_path: Storage path/identifier
+            chunk_size: Maximum bytes per yielded piece
+            
+        Yields:
+            Consecutive pieces of the file; nothing if not found
+        """
+        content = await self.get_file(file_path)
+        if content is None:
+            return
+        
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+    
+    async def get_files_batch(
+        self,
+        file_paths: List[str],
+        max_concurrency: int = FILE_BATCH_MAX_CONCURRENCY
+    ) -> List[Optional[bytes]]:
+        """
+        Retrieve many files with overlapping reads.
+        
+        Up to max_concurrency get_file calls are in flight at once, so N
+        remote round trips cost about N / max_concurrency. Adapters with a
+        native bulk read can override this.
+        
+        Args:
+            file_paths: Storage paths/identifiers
+            max_concurrency: Maximum concurrent get_file calls
+            
+        Returns:
+            File contents in input order, None for files not found
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def get_file_limited(file_path: str) -> Optional[bytes]:
+            async with semaphore:
+                return await self.get_file(file_path)
+        
+        return list(await asyncio.gather(*(get_file_limited(file_path) for file_path in file_paths)))
+    
     @abstractmethod
     async def delete_file(self, file_path: str) -> bool:
         """
@@ -1,14 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Callable, List, Dict, Any, Optional
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
-    """Information about tokenized text"""
-    token_count: int
-    tokens: List[str]
-    token_ids: Optional[List[int]] = None
+    """Information about tokenized text
+
+    Token strings are decoded from token_ids on first access to tokens, so
+    callers that only need the count never pay for decoding.
+    """
+    token_ids: List[int]
+    token_decoder: Optional[Callable[[List[int]], List[str]]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Decoded token strings, filled on first access to tokens
+    _tokens: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def token_count(self) -> int:
+        return len(self.token_ids)
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            if not self.token_ids or self.token_decoder is None:
+                self._tokens = []
+            else:
+                self._tokens = self.token_decoder(self.token_ids)
+        return self._tokens
 
 
 class TokenService(ABC):
@@ -19,6 +39,11 @@ class TokenService(ABC):
         """Count tokens in text"""
         pass
 
+    @abstractmethod
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts at once, preserving order"""
+        pass
+
     @abstractmethod
     def tokenize(self, text: str) -> TokenInfo:
         """Tokenize text and return detailed information"""
@@ -29,6 +54,11 @@ class TokenService(ABC):
         """Encode text to token IDs"""
         pass
 
+    @abstractmethod
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Encode many texts to token IDs at once, preserving order"""
+        pass
+
     @abstractmethod
     def decode_tokens(self, token_ids: List[int]) -> str:
         """Decode token IDs back to text"""
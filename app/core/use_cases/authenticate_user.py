@@ -20,7 +20,7 @@ class AuthenticateUserUseCase:
             logger.warning("Failed API key authentication attempt")
             raise AuthenticationError("Invalid API key")
         
-        logger.info(f"Successful API key authentication for user: {user.id}")
+        logger.info("Successful API key authentication for user: %s", user.id)
         return user
     
     async def authenticate_with_jwt(self, token: str) -> AuthenticatedUser:
@@ -33,7 +33,7 @@ class AuthenticateUserUseCase:
             logger.warning("Failed JWT authentication attempt")
             raise AuthenticationError("Invalid or expired JWT token")
         
-        logger.info(f"Successful JWT authentication for user: {user.id}")
+        logger.info("Successful JWT authentication for user: %s", user.id)
         return user
     
     async def authenticate_request(
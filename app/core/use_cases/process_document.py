@@ -1,4 +1,4 @@
-import traceback
+import logging
 from typing import List, Optional
 from app.core.domain.entities.document import Document
 from app.core.domain.entities.document_chunk import DocumentChunk
@@ -12,13 +12,17 @@ import asyncio
 import time
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessDocumentUseCase:
     def __init__(
         self,
-        document_processor: DocumentProcessor
+        document_processor: DocumentProcessor,
+        max_concurrency: int = 5
     ):
         self.document_processor = document_processor
+        self.max_concurrency = max_concurrency
 
     async def execute(
         self, 
@@ -39,24 +43,25 @@ class ProcessDocumentUseCase:
             # Step 1: Process the document to extract content and metadata
 
             # Extract text and create basic chunks
-            self.logger.info(f"Extracting text and creating chunks for document {document.id}")
+            logger.info("Extracting text and creating chunks for document %s", document.id)
             try:
                 doc_chunks, complete_text = await self.document_processor.process_document(document)
-                self.logger.info(f"Created {len(doc_chunks)} initial chunks from document {document.id}")
+                logger.info("Created %d initial chunks from document %s", len(doc_chunks), document.id)
             except Exception as e:
-                self.logger.error(f"Failed to process document for {document.id}: {str(e)}")
-                self.logger.error(f"Document processor error traceback: {traceback.format_exc()}")
+                # exc_info defers formatting the traceback until the record is emitted
+                logger.error("Failed to process document for %s: %s", document.id, e, exc_info=True)
                 raise DocumentProcessingError(f"Document processing failed: {str(e)}")
 
             if not doc_chunks:
                 error_msg = "No chunks created from document"
-                self.logger.error(f"{error_msg} for document {document.id}")
+                logger.error("%s for document %s", error_msg, document.id)
                 raise DocumentProcessingError(error_msg)
             
             # Step 4: Create processing result
             processing_time = time.time() - start_time
             
             result = ProcessingResult(
+                task_id=str(uuid.uuid4()),
                 document_id=document.id,
                 chunks=doc_chunks,
                 complete_text=complete_text,
@@ -70,17 +75,31 @@ class ProcessDocumentUseCase:
         except Exception as e:
             processing_time = time.time() - start_time
             
-            # Create error result
-            error_result = ProcessingResult(
-                document_id=document.id,
-                chunks=[],
-                complete_text=None,
-                metadata={"error": str(e)},
-                processing_time=processing_time,
-                status=ProcessingStatus.FAILED
-            )
-            
             raise DocumentProcessingError(
-                f"Failed to process document {document.id}: {str(e)}"
+                f"Failed to process document {document.id} after {processing_time:.2f}s: {str(e)}"
             ) from e
+
+    async def execute_batch(
+        self,
+        documents: List[Document]
+    ) -> List[ProcessingResult]:
+        """
+        Process many documents concurrently
+        
+        At most max_concurrency documents are in flight at once; the processor
+        runs their CPU-bound stages off the event loop, so they overlap.
+        
+        Args:
+            documents: The documents to process
+            
+        Returns:
+            ProcessingResults in input order; the first failure is raised
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def execute_limited(document: Document) -> ProcessingResult:
+            async with semaphore:
+                return await self.execute(document)
+        
+        return list(await asyncio.gather(*(execute_limited(document) for document in documents)))
         
\ No newline at end of file
@@ -2,6 +2,7 @@ from app.core.domain.entities.document import Document
 from app.core.domain.value_objects.document_type import DocumentType
 from app.core.domain.exceptions import DocumentValidationError
 from typing import List
+import asyncio
 import mimetypes
 import os
 
@@ -9,12 +10,12 @@ import os
 class ValidateDocumentUseCase:
     def __init__(self, max_file_size: int = 50 * 1024 * 1024):  # 50MB default
         self.max_file_size = max_file_size
-        self.supported_types = [
+        self.supported_types = frozenset({
             DocumentType.PDF,
             DocumentType.DOCX,
             DocumentType.DOC,
             DocumentType.TXT
-        ]
+        })
         
     async def execute(self, document: Document) -> bool:
         """
@@ -32,22 +33,37 @@ class ValidateDocumentUseCase:
         errors = []
         
         # Check file size
-        if document.size > self.max_file_size:
-            errors.append(f"File size {document.size} exceeds maximum {self.max_file_size}")
+        if document.file_size > self.max_file_size:
+            errors.append(f"File size {document.file_size} exceeds maximum {self.max_file_size}")
         
         # Check file type
         if document.document_type not in self.supported_types:
             errors.append(f"Document type {document.document_type} not supported")
         
-        # Check if file exists and is readable
-        if document.file_path and not os.path.exists(document.file_path):
+        # Check if file exists and is readable; stat off the event loop, it can block on slow disks
+        if document.file_path and not await asyncio.to_thread(os.path.exists, document.file_path):
             errors.append(f"File not found: {document.file_path}")
         
         # Check if file is not empty
-        if document.size == 0:
+        if document.file_size == 0:
             errors.append("Document is empty")
         
         if errors:
             raise DocumentValidationError("; ".join(errors))
         
         return True
+    
+    async def execute_batch(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate many documents, running their filesystem checks concurrently
+        
+        Args:
+            documents: The documents to validate
+            
+        Returns:
+            List[bool]: True for each valid document, in input order
+            
+        Raises:
+            DocumentValidationError: For the first document that fails validation
+        """
+        return list(await asyncio.gather(*(self.execute(document) for document in documents)))
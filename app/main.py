@@ -1,3 +1,4 @@
+import gc
 import os
 import logging
 import asyncio
@@ -15,8 +16,8 @@ from .infrastructure.logging import setup_logging, RequestLoggingMiddleware
 from .infrastructure.metrics import PrometheusMiddleware, metrics_endpoint
 from .config import settings
 # Import adapter classes
-from .adapters.token_service.tiktoken_service import TikTokenService
-from .adapters.document_processor.simple_spacy_layout import SimpleSpacyLayoutProcessor
+from .adapters.token_service.tiktoken_service import get_tiktoken_service
+from .adapters.document_processor.simple_spacy_layout import SimpleSpacyLayoutProcessor, load_spacy_model
 from .adapters.auth_service.simple_auth_service import SimpleAuthService
 # Imports for routers
 from .api.routes.documents import router as documents_router
@@ -92,15 +93,31 @@ async def on_startup():
             api_key=settings.auth_api_key.get_secret_value(),
             jwt_secret=settings.jwt_secret.get_secret_value(),
         )
-        # Token service
-        token_service = TikTokenService()
+        # Token service; BPE files are read from the configured local cache instead of downloaded
+        if settings.tiktoken_cache_dir:
+            os.environ.setdefault("TIKTOKEN_CACHE_DIR", settings.tiktoken_cache_dir)
+        # The BPE table and the spaCy model are independent and both slow to load, so load
+        # them concurrently; the processor below then gets both from their process caches
+        app.state.token_service, _ = await asyncio.gather(
+            asyncio.to_thread(get_tiktoken_service, settings.tokenizer_model),
+            asyncio.to_thread(
+                load_spacy_model, settings.spacy_model, SimpleSpacyLayoutProcessor.DEFAULT_LOCAL_MODEL_PATH
+            ),
+        )
         
         # Document processor - this will fail fast if spaCy model is not available
         app.state.document_processor = SimpleSpacyLayoutProcessor(
             spacy_model=settings.spacy_model,
-            token_service=token_service,
+            token_service=app.state.token_service,
+            cache_dir=settings.processing_cache_dir,
+            cache_max_bytes=settings.processing_cache_max_bytes,
+            split_workers=settings.split_workers,
         )
         
+        # The loaded models are long-lived; move them out of the collector's reach so
+        # GC passes triggered by per-request chunking garbage don't rescan them
+        gc.freeze()
+        
         logger.info("Startup complete: adapters instantiated successfully")
     except Exception as e:
         logger.error(f"Failed to initialize adapters: {e}")
@@ -109,6 +126,12 @@ async def on_startup():
 @app.on_event("shutdown")
 async def on_shutdown():
     logger.info("Application shutdown: closing resources...")
+    document_processor = getattr(app.state, "document_processor", None)
+    if document_processor is not None:
+        document_processor.close()
+    token_service = getattr(app.state, "token_service", None)
+    if token_service is not None:
+        token_service.close()
     logger.info("Shutdown complete.")
 
 app.include_router(